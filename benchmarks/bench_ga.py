@@ -0,0 +1,249 @@
+"""Benchmarks for the genetic algorithm.
+
+Micro-benchmarks time each phase of a generation and report individuals
+processed per second. Macro-benchmarks solve a fixed set of seeds and
+report the distribution of generations and seconds to a full tour; every
+tour they count as solved is checked with ``validate_tours()``, or with
+``Board.is_tour()`` when NumPy is missing.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_ga --output bench.json
+    python -m benchmarks.bench_ga --baseline bench.json
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from functools import partial
+
+from knight_tour.genetic import Chromosome, Population, evolve
+from knight_tour.scheduler import Scheduler
+
+
+def best_time(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def micro_benchmarks(individuals=2000, repeat=5, seed=0):
+    """Return individuals per second for each phase of a generation"""
+    random.seed(seed)
+    timings = {}
+
+    chromosomes = [Chromosome() for _ in range(individuals)]
+    partners = chromosomes[1:] + chromosomes[:1]
+
+    def crossover():
+        for chromosome, partner in zip(chromosomes, partners):
+            chromosome.crossover(partner)
+
+    def mutation():
+        for chromosome in chromosomes:
+            chromosome.mutation()
+
+    timings['crossover'] = best_time(crossover, repeat)
+    timings['mutation'] = best_time(mutation, repeat)
+
+    # check_moves repairs genes in place, so time it on fresh knights
+    timings['check_moves'] = min(
+        best_time(Population(individuals).check_population, 1) for _ in range(repeat))
+
+    population = Population(individuals)
+    population.check_population()
+
+    def evaluate_fitness():
+        for knight in population.knights:
+            knight.evaluate_fitness()
+
+    timings['evaluate_fitness'] = best_time(evaluate_fitness, repeat)
+    timings['evaluate'] = best_time(population.evaluate, repeat)
+
+    def create_new_generation():
+        population.create_new_generation()
+        population.generation -= 1
+
+    timings['create_new_generation'] = best_time(create_new_generation, repeat)
+
+    buffered = Population(individuals, double_buffered=True)
+    buffered.check_population()
+
+    def create_new_generation_buffered():
+        buffered.create_new_generation()
+        buffered.generation -= 1
+
+    timings['create_new_generation_buffered'] = best_time(create_new_generation_buffered, repeat)
+
+    try:
+        import numpy as np
+        from knight_tour.batch import NUM_GENES, evaluate_batch
+    except ImportError:
+        pass
+    else:
+        rng = np.random.default_rng(seed)
+        genes = rng.integers(0, 8, size=(individuals, NUM_GENES), dtype=np.int8)
+        cycle_directions = rng.choice(np.array([1, -1], dtype=np.int8), size=individuals)
+        timings['evaluate_batch'] = best_time(
+            lambda: evaluate_batch(genes.copy(), cycle_directions), repeat)
+
+    return {name: {'individuals_per_second': individuals / seconds}
+            for name, seconds in timings.items()}
+
+
+def summarize(values):
+    ordered = sorted(values)
+    return {
+        'min': ordered[0],
+        'median': statistics.median(ordered),
+        'mean': statistics.mean(ordered),
+        'p90': ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))],
+        'max': ordered[-1],
+    }
+
+
+def macro_benchmark(seeds=range(10), population_size=50, max_generations=5000,
+                    make_population=Population, make_scheduler=None):
+    """Solve once per seed and report generations and seconds to a full tour"""
+    runs = []
+    tours = []
+    for seed in seeds:
+        random.seed(seed)
+        start = time.perf_counter()
+        scheduler = make_scheduler() if make_scheduler else None
+        best_knight, generations = evolve(make_population(population_size), max_generations,
+                                          scheduler=scheduler)
+        runs.append({
+            'seed': seed,
+            'generations': generations,
+            'seconds': time.perf_counter() - start,
+        })
+        tours.append(best_knight.squares)
+        board = best_knight.board
+
+    # Checked independently of the GA's own fitness, all runs at once
+    if tours:
+        try:
+            from knight_tour.validate import validate_tours
+        except ImportError:
+            valid = [board.is_tour(tour) for tour in tours]
+        else:
+            valid = validate_tours(tours, board).tolist()
+        for run, passed in zip(runs, valid):
+            run['solved'] = passed
+
+    return {
+        'population_size': population_size,
+        'runs': runs,
+        'solved': sum(run['solved'] for run in runs),
+        'generations': summarize([run['generations'] for run in runs]),
+        'seconds': summarize([run['seconds'] for run in runs]),
+    }
+
+
+# Macro-benchmark variants reported next to the default GA, as
+# macro_benchmark() keyword arguments
+MACRO_VARIANTS = {
+    'warnsdorff_repair': {'make_population': partial(Population, warnsdorff=True)},
+    'warnsdorff_seed': {'make_population': partial(Population, seed_fraction=0.1)},
+    'warnsdorff_repair_and_seed': {
+        'make_population': partial(Population, warnsdorff=True, seed_fraction=0.1)},
+    'elite': {'make_population': partial(Population, elite=2)},
+    'elite_and_restarts': {
+        'make_population': partial(Population, elite=2),
+        'make_scheduler': partial(Scheduler, stagnation_limit=100, restart_fraction=0.8)},
+}
+
+
+def run_benchmarks(individuals, repeat, seeds, population_size):
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'micro': micro_benchmarks(individuals, repeat),
+        'macro': macro_benchmark(seeds, population_size),
+        'macro_variants': {
+            name: macro_benchmark(seeds, population_size, **options)
+            for name, options in MACRO_VARIANTS.items()
+        },
+    }
+
+
+def compare(current, baseline):
+    """Return report lines comparing current results against a baseline"""
+    lines = [f"{'benchmark':<28}{'baseline':>14}{'current':>14}{'change':>10}"]
+
+    for name, result in current['micro'].items():
+        if name not in baseline.get('micro', {}):
+            continue
+        old = baseline['micro'][name]['individuals_per_second']
+        new = result['individuals_per_second']
+        lines.append(f"{name + ' (ind/s)':<28}{old:>14.0f}{new:>14.0f}{new / old:>9.2f}x")
+
+    if 'macro' in baseline:
+        for metric in ('generations', 'seconds'):
+            old = baseline['macro'][metric]['median']
+            new = current['macro'][metric]['median']
+            # Lower is better here, so report the speedup
+            change = old / new if new else float('inf')
+            lines.append(f"{'median ' + metric:<28}{old:>14.3f}{new:>14.3f}{change:>9.2f}x")
+
+    return lines
+
+
+def time_to_solution_table(results):
+    """Return report lines with time-to-solution for every macro variant"""
+    lines = [f"{'variant':<28}{'solved':>8}{'median gens':>13}{'median s':>10}{'p90 s':>10}"]
+    variants = {'default': results['macro'], **results.get('macro_variants', {})}
+    for name, macro in variants.items():
+        lines.append(f"{name:<28}{macro['solved']:>5}/{len(macro['runs']):<2}"
+                     f"{macro['generations']['median']:>13}{macro['seconds']['median']:>10.3f}"
+                     f"{macro['seconds']['p90']:>10.3f}")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.bench_ga')
+    parser.add_argument('--individuals', type=int, default=2000,
+                        help='individuals per micro-benchmark (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='repeats per micro-benchmark, best time wins (default: %(default)s)')
+    parser.add_argument('--seeds', type=int, default=10,
+                        help='number of seeds for the macro-benchmark (default: %(default)s)')
+    parser.add_argument('--population-size', type=int, default=50,
+                        help='population size for the macro-benchmark (default: %(default)s)')
+    parser.add_argument('--output', metavar='FILE', help='write results as JSON to FILE')
+    parser.add_argument('--baseline', metavar='FILE', help='compare against results stored in FILE')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.individuals, args.repeat, range(args.seeds), args.population_size)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print('\n'.join(compare(results, baseline)))
+        print()
+    elif not args.output:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    # Keep stdout parseable when it carries the JSON results
+    table_file = sys.stderr if not (args.output or args.baseline) else sys.stdout
+    print('\n'.join(time_to_solution_table(results)), file=table_file)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Knight's Tour genetic algorithm engine."""
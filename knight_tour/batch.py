@@ -0,0 +1,263 @@
+"""Vectorized evaluation of a whole population at once.
+
+The population is stored as a ``(population_size, squares - 1)`` integer
+array of genes, 63 columns on the standard board. Repair and fitness are
+computed gene by gene, but each step is a handful of array operations over
+every individual, so the interpreted work per generation no longer grows
+with the population size.
+"""
+from array import array
+from functools import lru_cache
+
+import numpy as np
+
+from .board import NUM_DIRECTIONS
+from .genetic import BOARD
+
+NUM_GENES = BOARD.num_squares - 1
+_TRY_ORDER = np.arange(NUM_DIRECTIONS)
+
+
+@lru_cache(maxsize=None)
+def move_table(board):
+    # move_table(board)[square, gene] -> destination square, or -1 if off the board
+    return np.array(board.neighbors, dtype=np.intp).reshape(board.num_squares, NUM_DIRECTIONS)
+
+
+def path_dtype(board):
+    return np.int16 if board.num_squares <= np.iinfo(np.int16).max else np.int32
+
+
+def evaluate_batch(genes, cycle_directions, board=BOARD, paths=None, fitness=None, start=0,
+                   closed=False):
+    """Repair ``genes`` in place and return ``(paths, fitness)``.
+
+    Gives the same repaired genes, paths and fitness as running
+    ``Knight.check_moves`` followed by ``Knight.evaluate_fitness`` on every
+    row. ``paths`` holds square indices, ``fitness`` the number of squares
+    visited before the first dead end. Pass ``paths`` and ``fitness``
+    arrays to have them filled instead of allocated. With ``closed``, repairs
+    and fitness follow ``Knight.check_moves_closed`` instead.
+    """
+    population_size, num_genes = genes.shape
+    rows = np.arange(population_size)
+    table = move_table(board)
+
+    position = np.full(population_size, start, dtype=np.intp)
+    visited = np.zeros((population_size, board.num_squares), dtype=bool)
+    visited[:, start] = True
+    if paths is None:
+        paths = np.empty((population_size, num_genes + 1), dtype=path_dtype(board))
+    paths[:, 0] = start
+    alive = np.ones(population_size, dtype=bool)
+    if fitness is None:
+        fitness = np.ones(population_size, dtype=np.int32)
+    else:
+        fitness[:] = 1
+
+    # Each individual tries its gene first, then cycles through the other
+    # directions in its own cycle_direction
+    try_steps = cycle_directions.astype(np.intp)[:, None] * _TRY_ORDER
+    if closed:
+        returns = np.frombuffer(board.return_squares(start), dtype=np.uint8).astype(bool)
+        free_returns = np.full(population_size, np.count_nonzero(returns))
+
+    for i in range(num_genes):
+        directions = (genes[:, i, None] + try_steps) % NUM_DIRECTIONS
+        targets = table[position[:, None], directions]
+        free = targets >= 0
+        free &= ~visited[rows[:, None], np.where(free, targets, 0)]
+        if closed and i < num_genes - 1:
+            # Keep the last free return square for the final move, unless
+            # it is the only free square
+            preferred = free & ~(returns[targets] & (free_returns == 1)[:, None])
+            free = np.where(preferred.any(axis=1)[:, None], preferred, free)
+
+        found = free.any(axis=1)
+        first_free = free.argmax(axis=1)
+
+        genes[:, i] = np.where(found, directions[rows, first_free], genes[:, i])
+        position = np.where(found, targets[rows, first_free], position)
+        visited[rows[found], position[found]] = True
+        paths[:, i + 1] = position
+        if closed:
+            free_returns -= found & returns[position]
+
+        # Fitness stops counting at the first dead end
+        alive &= found
+        fitness += alive
+
+        # Dead-ended knights never move again, so once all of them are
+        # stuck the rest of every path is its last square
+        if not alive.any():
+            paths[:, i + 2:] = position[:, None]
+            break
+
+    if closed:
+        fitness += (fitness == board.num_squares) & returns[position]
+    return paths, fitness
+
+
+class BatchKnight:
+    """A single individual pulled out of a BatchPopulation."""
+
+    __slots__ = ('board', 'genes', 'cycle_direction', 'squares', 'fitness', 'closed')
+
+    def __init__(self, genes, cycle_direction, squares, fitness, board=BOARD, closed=False):
+        self.board = board
+        self.genes = array('B', genes.tolist())
+        self.cycle_direction = int(cycle_direction)
+        self.squares = array(board.square_typecode, squares.tolist())
+        self.fitness = int(fitness)
+        self.closed = closed
+
+    @property
+    def path(self):
+        positions = self.board.positions
+        return [positions[square] for square in self.squares]
+
+    @property
+    def position(self):
+        return self.board.positions[self.squares[-1]]
+
+
+class BatchPopulation:
+    """Array-backed drop-in for Population.
+
+    Selection, crossover and mutation follow Population and Chromosome,
+    applied to every individual at once. Children are bred into a second,
+    preallocated gene array that is swapped with the first each generation,
+    so the population's arrays are allocated once.
+    """
+
+    def __init__(self, population_size, board=None, mutation_rate=0.05, seed=None, elite=0, start=0,
+                 closed=False):
+        self.population_size = population_size
+        self.board = board if board else BOARD
+        # Square index every tour starts from
+        self.start = start
+        # Search for closed tours, which score target_fitness
+        self.closed = closed
+        self.target_fitness = self.board.num_squares + closed
+        self.num_genes = self.board.num_squares - 1
+        self.mutation_rate = mutation_rate
+        # Best rows carried unchanged into the next generation
+        self.elite = elite
+        # Rows at the front that were carried over already walked
+        self._carried = 0
+        self.generation = 1
+        self.rng = np.random.default_rng(seed)
+        shape = (population_size, self.num_genes)
+        self.genes = self.rng.integers(0, NUM_DIRECTIONS, size=shape, dtype=np.int8)
+        self.cycle_directions = self._random_cycle_directions(population_size)
+        self.paths = np.zeros((population_size, self.num_genes + 1), dtype=path_dtype(self.board))
+        self.fitness = np.zeros(population_size, dtype=np.int32)
+
+        # The next generation is written here, then swapped in
+        self._back_genes = np.empty_like(self.genes)
+        self._back_cycle_directions = np.empty_like(self.cycle_directions)
+        # Scratch space for check_population and create_new_generation
+        self._unrepaired = np.empty_like(self.genes)
+        self._first_parents = np.empty_like(self.genes)
+        self._from_first = np.empty(shape, dtype=bool)
+        self._uniform = np.empty(shape)
+        self._mutate = np.empty(shape, dtype=bool)
+        self._gene_index = np.arange(self.num_genes)
+
+    def _random_cycle_directions(self, count):
+        return self.rng.choice(np.array([1, -1], dtype=np.int8), size=count)
+
+    def check_population(self):
+        carried = self._carried
+        np.copyto(self._unrepaired, self.genes)
+        evaluate_batch(self.genes[carried:], self.cycle_directions[carried:], self.board,
+                       self.paths[carried:], self.fitness[carried:], self.start, self.closed)
+
+    def evaluate(self):
+        best = int(self.fitness.argmax())
+        return int(self.fitness[best]), self.knight(best)
+
+    def mean_fitness(self):
+        return float(self.fitness.mean())
+
+    def walk_counts(self):
+        """Total (repairs, dead_ends) of the last check_population"""
+        carried = self._carried
+        repairs = int((self.genes[carried:] != self._unrepaired[carried:]).sum())
+        paths = self.paths[carried:]
+        dead_ends = int((paths[:, 1:] == paths[:, :-1]).sum())
+        return repairs, dead_ends
+
+    def knight(self, index):
+        return BatchKnight(self.genes[index], self.cycle_directions[index],
+                           self.paths[index], self.fitness[index], self.board,
+                           self.closed)
+
+    def best_rows(self, count):
+        return np.argsort(-self.fitness, kind='stable')[:count]
+
+    def _swap_in(self, rows, new_cycle_directions):
+        # The back buffer already holds the new individuals after the first
+        # len(rows); put the walked ``rows`` in front of them and swap
+        carried = len(rows)
+        np.take(self.genes, rows, axis=0, out=self._back_genes[:carried])
+        self._back_cycle_directions[:carried] = self.cycle_directions[rows]
+        self._back_cycle_directions[carried:] = new_cycle_directions
+        self.paths[:carried] = self.paths[rows]
+        self.fitness[:carried] = self.fitness[rows]
+        self.fitness[carried:] = 0
+
+        self.genes, self._back_genes = self._back_genes, self.genes
+        self.cycle_directions, self._back_cycle_directions = (self._back_cycle_directions,
+                                                              self.cycle_directions)
+        self._carried = carried
+
+    def tournament_selection(self, count, size=3):
+        # Draw `count` tournaments of distinct contestants and return the
+        # indices of the two fittest in each
+        contestants = self.rng.integers(0, self.population_size, size=(count, size))
+        while True:
+            ordered = np.sort(contestants, axis=1)
+            clashes = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+            if not clashes.any():
+                break
+            contestants[clashes] = self.rng.integers(
+                0, self.population_size, size=(int(clashes.sum()), size))
+
+        ranking = np.argsort(-self.fitness[contestants], axis=1, kind='stable')
+        winners = np.take_along_axis(contestants, ranking[:, :2], axis=1)
+        return winners[:, 0], winners[:, 1]
+
+    def create_new_generation(self):
+        num_children = self.population_size - self.elite
+        pairs = (num_children + 1) // 2
+        parent1, parent2 = self.tournament_selection(pairs)
+
+        # Each pair yields two children, one per crossover order
+        first = np.concatenate([parent1, parent2])[:num_children]
+        second = np.concatenate([parent2, parent1])[:num_children]
+
+        crossover_points = self.rng.integers(1, self.num_genes, size=num_children)
+        from_first = np.less(self._gene_index, crossover_points[:, None],
+                             out=self._from_first[:num_children])
+        children = self._back_genes[self.elite:]
+        np.take(self.genes, second, axis=0, out=children)
+        first_parents = np.take(self.genes, first, axis=0, out=self._first_parents[:num_children])
+        np.copyto(children, first_parents, where=from_first)
+
+        uniform = self.rng.random(out=self._uniform[:num_children])
+        mutate = np.less(uniform, self.mutation_rate, out=self._mutate[:num_children])
+        children[mutate] = self.rng.integers(0, NUM_DIRECTIONS, size=int(np.count_nonzero(mutate)),
+                                             dtype=np.int8)
+
+        self._swap_in(self.best_rows(self.elite), self._random_cycle_directions(num_children))
+        self.generation += 1
+
+    def restart(self, fraction=1.0):
+        """Replace the worst ``fraction`` of the individuals with random ones"""
+        fresh = round(self.population_size * fraction)
+        kept = self.population_size - fresh
+        self._back_genes[kept:] = self.rng.integers(0, NUM_DIRECTIONS, size=(fresh, self.num_genes),
+                                                    dtype=np.int8)
+        self._swap_in(self.best_rows(kept), self._random_cycle_directions(fresh))
+        self.generation += 1
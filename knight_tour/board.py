@@ -0,0 +1,153 @@
+"""Board geometry shared by the engine and the renderer.
+
+Squares are numbered row by row, ``square = y * width + x``. Every board
+precomputes, once, a flat neighbor table where
+``neighbors[square * 8 + direction]`` is the destination of a knight move
+from ``square`` in ``direction`` (a gene value, 0-7), or -1 when the move
+leaves the board.
+
+For bitboard and Warnsdorff walks a board also keeps one bit per square,
+the mask of squares a knight attacks from each square, and the repair
+candidates of every (square, gene) pair with off-board moves already
+dropped. These grow with the square of the board size, so they are only
+built on first use.
+"""
+from functools import cached_property, lru_cache
+
+# Indexed by gene value, i.e. Knight direction - 1
+MOVE_OFFSETS = (
+    (-1, -2),  # up-right
+    (-2, -1),  # right-up
+    (-2, 1),   # right-down
+    (-1, 2),   # down-right
+    (1, 2),    # down-left
+    (2, 1),    # left-down
+    (2, -1),   # left-up
+    (1, -2),   # up-left
+)
+NUM_DIRECTIONS = len(MOVE_OFFSETS)
+
+# Directions tried, in order, when repairing gene g of a knight whose
+# cycle_direction is c: REPAIR_ORDERS[c][g]
+REPAIR_ORDERS = {
+    1: tuple(tuple((g + j) % NUM_DIRECTIONS for j in range(1, NUM_DIRECTIONS))
+             for g in range(NUM_DIRECTIONS)),
+    -1: tuple(tuple((g - j) % NUM_DIRECTIONS for j in range(1, NUM_DIRECTIONS))
+              for g in range(NUM_DIRECTIONS)),
+}
+
+
+class Board:
+    def __init__(self, width=8, height=8):
+        self.width = width
+        self.height = height
+        self.num_squares = width * height
+        self.positions = [(square % width, square // width) for square in range(self.num_squares)]
+        self.square_typecode = square_typecode(self.num_squares)
+        self.neighbors = self._build_neighbors()
+
+    def _build_neighbors(self):
+        neighbors = []
+        for x, y in self.positions:
+            for dx, dy in MOVE_OFFSETS:
+                new_x, new_y = x + dx, y + dy
+                if 0 <= new_x < self.width and 0 <= new_y < self.height:
+                    neighbors.append(new_y * self.width + new_x)
+                else:
+                    neighbors.append(-1)
+        return neighbors
+
+    @cached_property
+    def square_bits(self):
+        return [1 << square for square in range(self.num_squares)]
+
+    @cached_property
+    def attack_masks(self):
+        return self._build_attack_masks()
+
+    @cached_property
+    def repair_targets(self):
+        return {
+            cycle_direction: self._build_repair_targets(order)
+            for cycle_direction, order in REPAIR_ORDERS.items()
+        }
+
+    def _build_attack_masks(self):
+        masks = []
+        for square in range(self.num_squares):
+            mask = 0
+            for direction in range(NUM_DIRECTIONS):
+                target = self.move(square, direction)
+                if target >= 0:
+                    mask |= 1 << target
+            masks.append(mask)
+        return masks
+
+    def _build_repair_targets(self, repair_order):
+        # targets[square * 8 + gene] -> ((direction, square bit), ...) in
+        # repair order, on-board moves only
+        targets = []
+        for square in range(self.num_squares):
+            for gene in range(NUM_DIRECTIONS):
+                targets.append(tuple(
+                    (direction, self.square_bits[self.move(square, direction)])
+                    for direction in repair_order[gene]
+                    if self.move(square, direction) >= 0
+                ))
+        return targets
+
+    def __reduce__(self):
+        # Pickle by size, so knights sent between processes carry two ints
+        # and share the receiving process's cached board
+        return (get_board, (self.width, self.height))
+
+    def square(self, x, y):
+        return y * self.width + x
+
+    def position(self, square):
+        return self.positions[square]
+
+    def move(self, square, direction):
+        return self.neighbors[square * NUM_DIRECTIONS + direction]
+
+    def contains(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def return_squares(self, start):
+        """Flags of the squares a knight move from ``start``, where a closed tour can end"""
+        returns = bytearray(self.num_squares)
+        for square in self.neighbors[start * NUM_DIRECTIONS:(start + 1) * NUM_DIRECTIONS]:
+            if square >= 0:
+                returns[square] = 1
+        return returns
+
+    def is_tour(self, squares, closed=False):
+        """True if ``squares`` visits every square once by knight moves.
+
+        With ``closed``, the last square must also be a knight move from
+        the first.
+        """
+        if len(squares) != self.num_squares or len(set(squares)) != self.num_squares:
+            return False
+        if not all(0 <= square < self.num_squares for square in squares):
+            return False
+        neighbors = self.neighbors
+        for square, target in zip(squares, squares[1:]):
+            if target not in neighbors[square * NUM_DIRECTIONS:(square + 1) * NUM_DIRECTIONS]:
+                return False
+        return not closed or squares[0] in neighbors[squares[-1] * NUM_DIRECTIONS:
+                                                     (squares[-1] + 1) * NUM_DIRECTIONS]
+
+
+def square_typecode(num_squares):
+    """Smallest array typecode that holds every square index"""
+    return 'B' if num_squares <= 1 << 8 else 'H' if num_squares <= 1 << 16 else 'I'
+
+
+def popcount(mask):
+    return bin(mask).count('1')
+
+
+@lru_cache(maxsize=None)
+def get_board(width=8, height=8):
+    return Board(width, height)
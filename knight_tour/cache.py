@@ -0,0 +1,102 @@
+"""Bounded memo of walk results keyed by genome.
+
+Tournament selection breeds many duplicate chromosomes. With a FitnessCache
+on the Population, a duplicate takes its repaired genes and fitness, which
+together give its path, from the cache instead of being walked again.
+Least recently used entries are evicted once the estimated size passes
+``max_bytes``.
+"""
+from array import array
+from collections import OrderedDict
+
+# Rough cost of an entry besides its contents: the headers of the key and
+# genes, the entry tuple and its OrderedDict slot and link
+ENTRY_OVERHEAD = 240
+
+
+class FitnessCache:
+    """LRU map from (genes, cycle direction) to a finished walk.
+
+    The walk depends on the board, start square and repair mode too, so
+    share a cache only between populations that use the same ones.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(knight):
+        # Genes are 0-7, so they pack one per byte; the last byte holds
+        # the cycle direction, which changes how genes are repaired
+        return bytes(knight.chromosome.genes) + (b'+' if knight.cycle_direction > 0 else b'-')
+
+    def restore(self, key, knight):
+        """Copy a cached walk onto ``knight`` and return True, or False on a miss"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        genes, fitness, repairs, dead_ends, _ = entry
+        chromosome = knight.chromosome
+        chromosome.genes[:] = genes
+        # Nothing to resume from, and don't keep the parent alive
+        chromosome.parent = None
+        knight.fitness = fitness
+        knight.repairs = repairs
+        knight.dead_ends = dead_ends
+        return True
+
+    def store(self, key, knight):
+        """Remember the walk ``knight`` just finished under ``key``"""
+        genes = array('B', knight.chromosome.genes)
+        size = len(key) + len(genes) + ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[-1]
+        self._entries[key] = (genes, knight.fitness, knight.repairs, knight.dead_ends, size)
+        self.bytes += size
+
+        while self.bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= evicted[-1]
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes,
+            'hit_rate': self.hit_rate,
+        }
+
+    def summary(self):
+        return (f"fitness cache: {self.hits} hits, {self.misses} misses "
+                f"({self.hit_rate:.1%}), {self.evictions} evictions, "
+                f"{len(self._entries)} entries, {self.bytes / 1024 / 1024:.1f}/"
+                f"{self.max_bytes / 1024 / 1024:.1f} MiB")
@@ -0,0 +1,317 @@
+"""Command-line entry point: ``python -m knight_tour``.
+
+Solves a tour headlessly and prints the path, one ``x,y`` square per move.
+Pygame is only imported when ``--view`` is given.
+"""
+import argparse
+import json
+import random
+import sys
+import time
+
+from .board import get_board
+from .cache import FitnessCache
+from .genetic import Population, evolve
+from .instrumentation import Instrumentation
+from .scheduler import Scheduler
+from .store import TourStore
+
+
+def board_size(text):
+    """Parse ``8`` or ``6x9`` into (width, height)"""
+    try:
+        if 'x' in text:
+            width, height = (int(part) for part in text.lower().split('x'))
+        else:
+            width = height = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid board size {text!r}, expected N or WxH")
+    if width < 1 or height < 1:
+        raise argparse.ArgumentTypeError(f"invalid board size {text!r}, expected N or WxH")
+    # Crossover needs at least two genes, one per move
+    if width * height < 3:
+        raise argparse.ArgumentTypeError(f"board {text!r} is too small, it needs at least 3 squares")
+    return width, height
+
+
+def start_square(text):
+    """Parse ``all`` or ``x,y``"""
+    if text == 'all':
+        return text
+    try:
+        x, y = (int(part) for part in text.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid start square {text!r}, expected x,y or all")
+    return x, y
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m knight_tour',
+        description="Solve the Knight's Tour with a genetic algorithm.")
+    parser.add_argument('--board', type=board_size, default=(8, 8), metavar='N|WxH',
+                        help='board size, e.g. 16 or 6x9 (default: 8)')
+    parser.add_argument('--population-size', type=int, default=50,
+                        help='knights per population (default: %(default)s)')
+    parser.add_argument('--max-generations', type=int, default=None,
+                        help='give up and report the best partial tour after this many generations')
+    parser.add_argument('--max-seconds', type=float, default=None,
+                        help='give up and report the best partial tour after this many seconds')
+    parser.add_argument('--elite', type=int, default=0, metavar='K',
+                        help='carry the K best knights unchanged into the next generation')
+    parser.add_argument('--stagnation', type=int, default=None, metavar='N',
+                        help='restart after N generations without a better best fitness')
+    parser.add_argument('--restart-fraction', type=float, default=1.0, metavar='F',
+                        help='share of the population replaced on a restart, keeping the best '
+                             '(default: %(default)s)')
+    parser.add_argument('--max-restarts', type=int, default=None,
+                        help='stop restarting after this many restarts')
+    parser.add_argument('--closed', action='store_true',
+                        help='search for a closed tour, ending a knight move from the start')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='random seed for a reproducible run')
+    parser.add_argument('--engine', choices=['scalar', 'batch'], default='scalar',
+                        help='scalar Python engine or NumPy batch engine (default: %(default)s)')
+    parser.add_argument('--bitboard', action='store_true',
+                        help='track visited squares in a bitboard (scalar engine)')
+    parser.add_argument('--incremental', action='store_true',
+                        help="resume crossover children from their parent's walk (scalar engine)")
+    parser.add_argument('--mutation-rate', type=float, default=0.05, metavar='P',
+                        help='per-gene mutation probability (default: %(default)s)')
+    parser.add_argument('--warnsdorff', action='store_true',
+                        help="repair illegal genes with Warnsdorff's rule (scalar engine)")
+    parser.add_argument('--seed-fraction', type=float, default=0.0, metavar='F',
+                        help='fraction of the initial population seeded with Warnsdorff walks '
+                             '(scalar engine, default: %(default)s)')
+    parser.add_argument('--double-buffered', action='store_true',
+                        help='breed children into a preallocated second generation (scalar engine)')
+    parser.add_argument('--fitness-cache', type=float, default=0, metavar='MIB',
+                        help='reuse walks of duplicate chromosomes from an LRU cache of up to '
+                             'MIB mebibytes per population (scalar engine)')
+    parser.add_argument('--islands', type=int, default=0,
+                        help='run this many islands in parallel processes (0: single population)')
+    parser.add_argument('--starts', type=start_square, nargs='+', metavar='x,y|all',
+                        help='solve a tour from each of these start squares, or all of them, '
+                             'in parallel processes, printing each tour as it is found')
+    parser.add_argument('--processes', type=int, default=None,
+                        help='worker processes for --starts (default: one per CPU)')
+    parser.add_argument('--stats', action='store_true',
+                        help='print per-phase timings and counters (single population only)')
+    parser.add_argument('--store', metavar='FILE', default=None,
+                        help='tour library to read stored tours from and add new ones to '
+                             '(default: $KNIGHT_TOUR_STORE or the user cache directory)')
+    parser.add_argument('--no-store', action='store_true',
+                        help='neither read nor write the tour library')
+    parser.add_argument('--check-store', action='store_true',
+                        help="validate every stored (closed) tour of the board and exit")
+    parser.add_argument('--new', action='store_true',
+                        help='run the GA even if a tour is stored, and store the new tour')
+    parser.add_argument('--output', metavar='FILE',
+                        help='write the result as JSON to FILE instead of printing the path')
+    parser.add_argument('--view', action='store_true',
+                        help='open the Pygame viewer on the solution')
+    return parser
+
+
+def population_options(args, cache=None):
+    # Islands each get a pickled copy of the cache
+    return {'warnsdorff': args.warnsdorff, 'seed_fraction': args.seed_fraction,
+            'mutation_rate': args.mutation_rate, 'cache': cache, 'elite': args.elite,
+            'double_buffered': args.double_buffered, 'closed': args.closed,
+            'bitboard': args.bitboard, 'incremental': args.incremental}
+
+
+def build_scheduler(args):
+    if args.max_seconds is None and args.stagnation is None:
+        return None
+    return Scheduler(max_seconds=args.max_seconds, stagnation_limit=args.stagnation,
+                     restart_fraction=args.restart_fraction, max_restarts=args.max_restarts)
+
+
+def run_search(args, board, instrumentation=None, cache=None):
+    if args.islands:
+        from .islands import run_islands
+        result = run_islands(args.islands, args.population_size,
+                             max_generations=args.max_generations, seed=args.seed, board=board,
+                             population_options=population_options(args, cache))
+        return result.knight, result.generation
+
+    if args.engine == 'batch':
+        from .batch import BatchPopulation
+        population = BatchPopulation(args.population_size, board, args.mutation_rate, seed=args.seed,
+                                     elite=args.elite, closed=args.closed)
+    else:
+        if args.seed is not None:
+            random.seed(args.seed)
+        population = Population(args.population_size, board, **population_options(args, cache))
+    return evolve(population, args.max_generations, instrumentation, build_scheduler(args))
+
+
+def start_squares(parser, args, board):
+    if 'all' in args.starts:
+        return list(range(board.num_squares))
+    starts = []
+    for x, y in args.starts:
+        if not board.contains(x, y):
+            parser.error(f'start square {x},{y} is off the {board.width}x{board.height} board')
+        starts.append(board.square(x, y))
+    return starts
+
+
+def run_starts(args, board, starts, store=None):
+    """Solve from every start square and print each tour as it arrives"""
+    from .starts import StartResult, solve_starts
+
+    began = time.perf_counter()
+    results = []
+    pending = []
+    stored = set()
+    for start in starts:
+        tour = None if store is None or args.new else store.get(board, start, args.closed)
+        if tour is None:
+            pending.append(start)
+        else:
+            stored.add(start)
+            results.append(StartResult(start, tour, 0, 0.0, tour.fitness))
+            report_start(results[-1], board, args.output is None, stored=True)
+
+    if args.engine == 'batch':
+        options = {'mutation_rate': args.mutation_rate, 'elite': args.elite, 'closed': args.closed}
+    else:
+        options = population_options(args)
+    for result in solve_starts(pending, board, args.population_size, args.max_generations,
+                               options, args.seed, args.processes, build_scheduler(args),
+                               args.engine):
+        if result.solved and store is not None:
+            store.add(board, result.knight.squares, args.closed)
+        results.append(result)
+        report_start(result, board, args.output is None)
+
+    elapsed = time.perf_counter() - began
+    solved = sum(result.solved for result in results)
+    print(f"Solved {solved}/{len(results)} start squares in {elapsed:.3f}s", file=sys.stderr)
+
+    if args.output:
+        results.sort(key=lambda result: result.start)
+        with open(args.output, 'w') as f:
+            json.dump([{
+                'board': list(args.board),
+                'closed': args.closed,
+                'start': list(board.position(result.start)),
+                'solved': result.solved,
+                'stored': result.start in stored,
+                'fitness': result.fitness,
+                'generations': result.generations,
+                'seconds': result.seconds,
+                'path': [list(position) for position in result.knight.path],
+            } for result in results], f)
+    return 0 if solved == len(results) else 1
+
+
+def report_start(result, board, print_path=True, stored=False):
+    x, y = board.position(result.start)
+    how = 'from the tour library' if stored else (f'after {result.generations} generations '
+                                                   f'in {result.seconds:.3f}s')
+    print(f"Start {x},{y}: fitness {result.fitness}/{result.target_fitness} {how}", file=sys.stderr)
+    if print_path:
+        print(' '.join(f'{x},{y}' for x, y in result.knight.path), flush=True)
+
+
+def check_store(store, board, closed=False):
+    """Validate every stored tour of ``board`` at once and report the failures"""
+    from .validate import check_tours
+
+    tours = [tour for start in range(board.num_squares)
+             for tour in store.tours(board, start, closed)]
+    kind = 'closed tours' if closed else 'tours'
+    if not tours:
+        print(f"No stored {kind} of the {board.width}x{board.height} board in {store.path}",
+              file=sys.stderr)
+        return 0
+
+    checks = check_tours([tour.squares for tour in tours], board, closed)
+    failures = 0
+    for index, tour in enumerate(tours):
+        failed = [name for name, passed in checks.items() if not passed[index]]
+        if failed:
+            failures += 1
+            x, y = board.position(tour.start)
+            print(f"Tour {index} from {x},{y} fails: {', '.join(failed)}", file=sys.stderr)
+    print(f"{len(tours) - failures}/{len(tours)} stored {kind} of the {board.width}x{board.height} "
+          f"board are valid", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.engine == 'batch' and (args.warnsdorff or args.seed_fraction or args.fitness_cache or
+                                   args.bitboard or args.incremental or args.double_buffered or
+                                   args.islands):
+        parser.error('--warnsdorff, --seed-fraction, --fitness-cache, --bitboard, --incremental, '
+                     '--double-buffered and --islands need the scalar engine')
+    if args.islands and (args.max_seconds is not None or args.stagnation is not None or args.stats):
+        parser.error('--max-seconds, --stagnation and --stats need a single population')
+    if args.population_size < 3:
+        parser.error('--population-size must be at least 3, the tournament size')
+    if not 0 <= args.elite < args.population_size:
+        parser.error('--elite must be less than --population-size')
+    if args.starts and (args.islands or args.view or args.stats or args.fitness_cache):
+        parser.error('--starts cannot be combined with --islands, --view, --stats or '
+                     '--fitness-cache')
+
+    board = get_board(*args.board)
+    instrumentation = Instrumentation() if args.stats else None
+    cache = FitnessCache(int(args.fitness_cache * 1024 * 1024)) if args.fitness_cache else None
+    store = None if args.no_store else TourStore(args.store)
+    if args.check_store:
+        if store is None:
+            parser.error('--check-store needs the tour library')
+        return check_store(store, board, args.closed)
+    if args.starts:
+        return run_starts(args, board, start_squares(parser, args, board), store)
+
+    start = time.perf_counter()
+    best_knight = None if store is None or args.new else store.get(board, closed=args.closed)
+    stored = best_knight is not None
+    if stored:
+        generations = 0
+    else:
+        best_knight, generations = run_search(args, board, instrumentation, cache)
+    elapsed = time.perf_counter() - start
+    target_fitness = board.num_squares + args.closed
+    solved = best_knight.fitness == target_fitness
+    if solved and not stored and store is not None:
+        store.add(board, best_knight.squares, args.closed)
+
+    if stored:
+        print(f"Fitness {best_knight.fitness}/{target_fitness} from {store.path} "
+              f"in {elapsed * 1e6:.0f}us", file=sys.stderr)
+    else:
+        print(f"Fitness {best_knight.fitness}/{target_fitness} after {generations} generations "
+              f"in {elapsed:.3f}s", file=sys.stderr)
+    if instrumentation is not None and not stored:
+        print('\n'.join(instrumentation.summary()), file=sys.stderr)
+        if cache is not None:
+            print(cache.summary(), file=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'board': list(args.board),
+                'closed': args.closed,
+                'solved': solved,
+                'stored': stored,
+                'fitness': best_knight.fitness,
+                'generations': generations,
+                'seconds': elapsed,
+                'path': [list(position) for position in best_knight.path],
+            }, f)
+    else:
+        print(' '.join(f'{x},{y}' for x, y in best_knight.path))
+
+    if args.view:
+        from .viewer import run
+        run(best_knight, generations)
+
+    return 0 if solved else 1
@@ -0,0 +1,769 @@
+"""Genetic algorithm engine: chromosomes, knights and populations.
+
+Importing this module does not touch pygame, so the engine can run in
+worker processes and on machines without a display.
+"""
+import random
+from array import array
+
+from .board import MOVE_OFFSETS, REPAIR_ORDERS, get_board, popcount
+
+# The standard chessboard, used whenever no board is given
+BOARD = get_board(8, 8)
+
+
+class Chromosome:
+    __slots__ = ('genes', 'parent', 'shared_prefix', 'squares', 'checkpoints')
+    
+    def __init__(self, genes=None, length=None):
+        # One byte per gene
+        if genes is None:
+            if length is None:
+                length = BOARD.num_squares - 1
+            self.genes = array('B', [random.randint(0, 7) for _ in range(length)])
+        else:
+            self.genes = array('B', genes)
+        # genes[:shared_prefix] are unchanged from the already walked
+        # genes of parent, so an incremental walk can resume from there
+        self.parent = None
+        self.shared_prefix = 0
+        # Left by an incremental walk for children to resume from: the
+        # walked squares and the visited squares every checkpoint interval
+        self.squares = None
+        self.checkpoints = None
+    
+    def crossover(self, partner):
+        crossover_point = random.randint(1, len(self.genes) - 1)
+        child_genes = self.genes[:crossover_point] + partner.genes[crossover_point:]
+        child = Chromosome(child_genes)
+        if self.checkpoints is not None:
+            child.parent = self
+            child.shared_prefix = crossover_point
+        return child
+    
+    def crossover_into(self, partner, child):
+        """Like crossover(), but overwrite the genes of an existing ``child``"""
+        crossover_point = random.randint(1, len(self.genes) - 1)
+        genes = child.genes
+        genes[:crossover_point] = self.genes[:crossover_point]
+        genes[crossover_point:] = partner.genes[crossover_point:]
+        child.squares = child.checkpoints = None
+        if self.checkpoints is not None:
+            child.parent = self
+            child.shared_prefix = crossover_point
+        else:
+            child.parent = None
+            child.shared_prefix = 0
+        return child
+    
+    def mutation(self, mutation_rate=0.05):
+        for i in range(len(self.genes)):
+            if random.random() < mutation_rate:
+                self.genes[i] = random.randint(0, 7)
+                if i < self.shared_prefix:
+                    self.shared_prefix = i
+
+
+class Knight:
+    __slots__ = ('board', 'chromosome', 'warnsdorff', 'start', 'closed', 'bitboard', 'incremental',
+                 'fitness', 'cycle_direction', 'repairs', 'dead_ends')
+    
+    # Genes between saved walk states in incremental mode, at least; on
+    # large boards the interval grows so that a walk saves no more than
+    # MAX_CHECKPOINTS states, each a byte per square
+    CHECKPOINT_INTERVAL = 8
+    MAX_CHECKPOINTS = 8
+    
+    def __init__(self, chromosome=None, board=None, warnsdorff=False, cycle_direction=None, start=0,
+                 closed=False, bitboard=False, incremental=False):
+        self.board = board if board else BOARD
+        self.chromosome = chromosome if chromosome else Chromosome(length=self.board.num_squares - 1)
+        # Repair illegal genes with Warnsdorff's rule instead of cycling
+        self.warnsdorff = warnsdorff
+        # Square index the walk starts from
+        self.start = start
+        # Search for closed tours: a full walk ending a knight move from
+        # the start scores one more than the number of squares
+        self.closed = closed
+        # Track visited squares in an integer bitmask instead of a bytearray
+        self.bitboard = bitboard
+        # Resume crossover children from their parent's walk, saving
+        # bytearray checkpoints of the visited squares as it goes
+        self.incremental = incremental
+        # Squares visited before the first dead end, plus one for a closed
+        # tour; with the repaired genes this is all it takes to rebuild the path
+        self.fitness = 0
+        self.cycle_direction = cycle_direction if cycle_direction else random.choice([1, -1])
+        # Genes repaired and dead ends hit by the last check_moves
+        self.repairs = 0
+        self.dead_ends = 0
+    
+    def copy(self):
+        """Return a knight with a copy of this one's genes and walk"""
+        knight = Knight(Chromosome(self.chromosome.genes), self.board, self.warnsdorff,
+                        self.cycle_direction, self.start, self.closed, self.bitboard,
+                        self.incremental)
+        knight.copy_walk(self)
+        return knight
+    
+    def reset(self):
+        """Forget the last walk before walking new genes, as a new Knight would"""
+        self.fitness = 0
+        self.cycle_direction = random.choice([1, -1])
+        self.repairs = 0
+        self.dead_ends = 0
+    
+    def copy_walk(self, other):
+        """Overwrite this knight's genes and walk with ``other``'s"""
+        chromosome = self.chromosome
+        source = other.chromosome
+        chromosome.genes[:] = source.genes
+        chromosome.parent = None
+        chromosome.shared_prefix = 0
+        # Saved walks are never changed in place, so they can be shared
+        chromosome.squares = source.squares
+        chromosome.checkpoints = source.checkpoints
+        self.cycle_direction = other.cycle_direction
+        self.fitness = other.fitness
+        self.repairs = other.repairs
+        self.dead_ends = other.dead_ends
+    
+    @property
+    def squares(self):
+        """Walked square indices, rebuilt from the repaired genes on each access.
+
+        The first fitness - 1 genes are legal moves, and the knight stays
+        on the square of its first dead end for the rest of the path.
+        """
+        neighbors = self.board.neighbors
+        genes = self.chromosome.genes
+        square = self.start
+        squares = array(self.board.square_typecode, [square])
+        for move in genes[:max(self.fitness - 1, 0)]:
+            square = neighbors[square * 8 + move]
+            squares.append(square)
+        if self.fitness:
+            squares.extend([square] * (len(genes) + 1 - len(squares)))
+        return squares
+    
+    @property
+    def path(self):
+        """The walked squares as (x, y) positions, built on each access"""
+        positions = self.board.positions
+        return [positions[square] for square in self.squares]
+    
+    @property
+    def position(self):
+        return self.board.positions[self.squares[-1]]
+    
+    def move_forward(self, direction):
+        dx, dy = MOVE_OFFSETS[direction - 1]
+        return (self.position[0] + dx, self.position[1] + dy)
+    
+    def move_backward(self, direction):
+        dx, dy = MOVE_OFFSETS[direction - 1]
+        return (self.position[0] - dx, self.position[1] - dy)
+    
+    def check_moves(self):
+        if self.closed:
+            return self.check_moves_closed()
+        if self.incremental:
+            return self.check_moves_incremental()
+        if self.warnsdorff:
+            return self.check_moves_warnsdorff()
+        if self.bitboard:
+            return self.check_moves_bitboard()
+        
+        neighbors = self.board.neighbors
+        genes = self.chromosome.genes
+        repair_order = REPAIR_ORDERS[self.cycle_direction]
+        
+        square = self.start
+        visited = bytearray(self.board.num_squares)
+        visited[square] = 1
+        repairs = dead_ends = 0
+        fitness = len(genes) + 1
+        
+        for i, move in enumerate(genes):
+            new_square = neighbors[square * 8 + move]
+            
+            if new_square < 0 or visited[new_square]:
+                # Repair the gene with the next free direction, if any
+                for new_move in repair_order[move]:
+                    new_square = neighbors[square * 8 + new_move]
+                    if new_square >= 0 and not visited[new_square]:
+                        genes[i] = new_move
+                        repairs += 1
+                        break
+                else:
+                    # A knight with no free neighbor never moves again, so
+                    # every remaining gene is a dead end on this square
+                    fitness = i + 1
+                    dead_ends = len(genes) - i
+                    break
+            
+            square = new_square
+            visited[square] = 1
+        
+        self.repairs = repairs
+        self.dead_ends = dead_ends
+        # Squares visited before the first dead end, as evaluate_fitness
+        # would count them on the repaired genes
+        self.fitness = fitness
+    
+    def check_moves_bitboard(self):
+        neighbors = self.board.neighbors
+        square_bits = self.board.square_bits
+        attack_masks = self.board.attack_masks
+        repair_targets = self.board.repair_targets[self.cycle_direction]
+        genes = self.chromosome.genes
+        
+        square = self.start
+        visited = square_bits[square]
+        repairs = dead_ends = 0
+        fitness = len(genes) + 1
+        
+        for i, move in enumerate(genes):
+            new_square = neighbors[square * 8 + move]
+            
+            if new_square < 0 or visited & square_bits[new_square]:
+                new_square = square
+                # Only look for a repair if some neighbor is still free
+                if attack_masks[square] & ~visited:
+                    for new_move, bit in repair_targets[square * 8 + move]:
+                        if not visited & bit:
+                            genes[i] = new_move
+                            new_square = neighbors[square * 8 + new_move]
+                            repairs += 1
+                            break
+                else:
+                    fitness = i + 1
+                    dead_ends = len(genes) - i
+                    break
+            
+            square = new_square
+            visited |= square_bits[square]
+        
+        self.repairs = repairs
+        self.dead_ends = dead_ends
+        self.fitness = fitness
+    
+    def check_moves_warnsdorff(self):
+        neighbors = self.board.neighbors
+        square_bits = self.board.square_bits
+        attack_masks = self.board.attack_masks
+        repair_targets = self.board.repair_targets[self.cycle_direction]
+        genes = self.chromosome.genes
+        
+        square = self.start
+        visited = square_bits[square]
+        repairs = dead_ends = 0
+        fitness = len(genes) + 1
+        
+        for i, move in enumerate(genes):
+            new_square = neighbors[square * 8 + move]
+            
+            if new_square < 0 or visited & square_bits[new_square]:
+                new_square = square
+                if attack_masks[square] & ~visited:
+                    # Move to the free neighbor with the fewest onward
+                    # moves, ties going to the first in cycle order
+                    best_degree = 9
+                    for new_move, bit in repair_targets[square * 8 + move]:
+                        if not visited & bit:
+                            target = neighbors[square * 8 + new_move]
+                            degree = popcount(attack_masks[target] & ~visited)
+                            if degree < best_degree:
+                                best_degree = degree
+                                genes[i] = new_move
+                                new_square = target
+                    repairs += 1
+                else:
+                    fitness = i + 1
+                    dead_ends = len(genes) - i
+                    break
+            
+            square = new_square
+            visited |= square_bits[square]
+        
+        self.repairs = repairs
+        self.dead_ends = dead_ends
+        self.fitness = fitness
+    
+    def check_moves_closed(self):
+        """Repair the genes toward a closed tour.
+
+        Like check_moves(), but the last free square a knight move from the
+        start is kept for the final move: a gene that would take it earlier
+        is repaired to another free square if there is one. Warnsdorff
+        repairs apply as usual; bitboard and incremental walks are not used.
+        """
+        board = self.board
+        neighbors = board.neighbors
+        repair_order = REPAIR_ORDERS[self.cycle_direction]
+        genes = self.chromosome.genes
+        warnsdorff = self.warnsdorff
+        last = len(genes) - 1
+        
+        square = self.start
+        visited = bytearray(board.num_squares)
+        visited[square] = 1
+        returns = board.return_squares(square)
+        free_returns = sum(returns)
+        repairs = dead_ends = 0
+        fitness = len(genes) + 1
+        
+        for i, move in enumerate(genes):
+            new_square = neighbors[square * 8 + move]
+            reserved = free_returns == 1 and i < last
+            
+            if new_square < 0 or visited[new_square] or (reserved and returns[new_square]):
+                # Free squares in repair order, the reserved one only as a
+                # last resort; with Warnsdorff the fewest onward moves win
+                fallback = new_square if new_square >= 0 and not visited[new_square] else -1
+                fallback_move = move
+                new_square = -1
+                best_degree = 9
+                for new_move in repair_order[move]:
+                    target = neighbors[square * 8 + new_move]
+                    if target < 0 or visited[target]:
+                        continue
+                    if reserved and returns[target]:
+                        if fallback < 0:
+                            fallback, fallback_move = target, new_move
+                        continue
+                    if not warnsdorff:
+                        new_square = target
+                        genes[i] = new_move
+                        break
+                    degree = 0
+                    for onward in neighbors[target * 8:target * 8 + 8]:
+                        if onward >= 0 and not visited[onward]:
+                            degree += 1
+                    if degree < best_degree:
+                        best_degree = degree
+                        new_square = target
+                        genes[i] = new_move
+                
+                if new_square < 0:
+                    new_square = fallback
+                    genes[i] = fallback_move
+                if new_square < 0:
+                    fitness = i + 1
+                    dead_ends = len(genes) - i
+                    break
+                if genes[i] != move:
+                    repairs += 1
+            
+            square = new_square
+            visited[square] = 1
+            free_returns -= returns[square]
+        
+        if fitness == board.num_squares and returns[square]:
+            fitness += 1
+        self.repairs = repairs
+        self.dead_ends = dead_ends
+        self.fitness = fitness
+    
+    def checkpoint_interval(self):
+        return max(self.CHECKPOINT_INTERVAL, -(-len(self.chromosome.genes) // self.MAX_CHECKPOINTS))
+    
+    def _resume_state(self):
+        """Return the parent's walk state to resume from, if any.
+
+        The shared prefix holds the parent's repaired genes, which replay
+        without repairs under any cycle direction, so the parent's state
+        after them is exactly the child's.
+        """
+        chromosome = self.chromosome
+        parent = chromosome.parent
+        # Don't keep every ancestor alive through the chain of parents
+        chromosome.parent = None
+        if parent is None or parent.checkpoints is None:
+            return None
+        
+        # The parent's walk stops at its first dead end, and so do its
+        # checkpoints; resuming from the last one meets the same dead end
+        interval = self.checkpoint_interval()
+        index = min(chromosome.shared_prefix // interval, len(parent.checkpoints) - 1)
+        if index <= 0:
+            return None
+        start = index * interval
+        return start, parent.squares[:start + 1], parent.checkpoints[:index], parent.checkpoints[index]
+    
+    def check_moves_incremental(self):
+        board = self.board
+        neighbors = board.neighbors
+        repair_order = REPAIR_ORDERS[self.cycle_direction]
+        chromosome = self.chromosome
+        genes = chromosome.genes
+        interval = self.checkpoint_interval()
+        warnsdorff = self.warnsdorff
+        
+        resume = self._resume_state()
+        if resume is None:
+            start = 0
+            squares = array(board.square_typecode, [self.start])
+            checkpoints = []
+            visited = bytearray(board.num_squares)
+            visited[self.start] = 1
+        else:
+            start, squares, checkpoints, visited = resume
+            visited = bytearray(visited)
+        square = squares[-1]
+        next_checkpoint = start
+        repairs = dead_ends = 0
+        fitness = len(genes) + 1
+        
+        for i in range(start, len(genes)):
+            if i == next_checkpoint:
+                checkpoints.append(bytes(visited))
+                next_checkpoint += interval
+            
+            move = genes[i]
+            new_square = neighbors[square * 8 + move]
+            
+            if new_square < 0 or visited[new_square]:
+                new_square = -1
+                best_degree = 9
+                for new_move in repair_order[move]:
+                    target = neighbors[square * 8 + new_move]
+                    if target < 0 or visited[target]:
+                        continue
+                    if not warnsdorff:
+                        new_square = target
+                        genes[i] = new_move
+                        break
+                    # Fewest onward moves, ties to the first in cycle order
+                    degree = 0
+                    for onward in neighbors[target * 8:target * 8 + 8]:
+                        if onward >= 0 and not visited[onward]:
+                            degree += 1
+                    if degree < best_degree:
+                        best_degree = degree
+                        new_square = target
+                        genes[i] = new_move
+                
+                if new_square < 0:
+                    fitness = i + 1
+                    dead_ends = len(genes) - i
+                    squares.extend([square] * dead_ends)
+                    break
+                repairs += 1
+            
+            square = new_square
+            squares.append(square)
+            visited[square] = 1
+        
+        chromosome.squares = squares
+        chromosome.checkpoints = checkpoints
+        
+        self.repairs = repairs
+        self.dead_ends = dead_ends
+        self.fitness = fitness
+    
+    def evaluate_fitness(self):
+        if self.bitboard:
+            return self.evaluate_fitness_bitboard()
+        
+        neighbors = self.board.neighbors
+        square = self.start
+        visited = bytearray(self.board.num_squares)
+        visited[square] = 1
+        fitness = 1
+        
+        for move in self.chromosome.genes:
+            new_square = neighbors[square * 8 + move]
+            if new_square < 0 or visited[new_square]:
+                break
+            square = new_square
+            visited[square] = 1
+            fitness += 1
+        
+        if self.closed and fitness == self.board.num_squares and self.closes(square):
+            fitness += 1
+        self.fitness = fitness
+        return self.fitness
+    
+    def evaluate_fitness_bitboard(self):
+        neighbors = self.board.neighbors
+        square_bits = self.board.square_bits
+        square = self.start
+        visited = square_bits[square]
+        
+        for move in self.chromosome.genes:
+            new_square = neighbors[square * 8 + move]
+            if new_square < 0 or visited & square_bits[new_square]:
+                break
+            square = new_square
+            visited |= square_bits[square]
+        
+        self.fitness = popcount(visited)
+        if self.closed and self.fitness == self.board.num_squares and self.closes(square):
+            self.fitness += 1
+        return self.fitness
+    
+    def closes(self, square):
+        """True if ``square`` is a knight move from the start square"""
+        start = self.start * 8
+        return square in self.board.neighbors[start:start + 8]
+
+
+def warnsdorff_chromosome(board=None, start=0):
+    """Build genes that follow Warnsdorff's rule from the ``start`` square.
+
+    Each step goes to the free neighbor with the fewest onward moves, ties
+    broken at random. Past a dead end the remaining genes are random.
+    """
+    board = board if board else BOARD
+    neighbors = board.neighbors
+    square_bits = board.square_bits
+    attack_masks = board.attack_masks
+    
+    genes = []
+    square = start
+    visited = square_bits[square]
+    
+    for _ in range(board.num_squares - 1):
+        best_moves = []
+        best_degree = 9
+        for move in range(8):
+            target = neighbors[square * 8 + move]
+            if target < 0 or visited & square_bits[target]:
+                continue
+            degree = popcount(attack_masks[target] & ~visited)
+            if degree < best_degree:
+                best_degree = degree
+                best_moves = [move]
+            elif degree == best_degree:
+                best_moves.append(move)
+        
+        if not best_moves:
+            genes.extend(random.randint(0, 7) for _ in range(board.num_squares - 1 - len(genes)))
+            break
+        
+        move = random.choice(best_moves)
+        genes.append(move)
+        square = neighbors[square * 8 + move]
+        visited |= square_bits[square]
+    
+    return Chromosome(genes)
+
+
+class Population:
+    def __init__(self, population_size, board=None, warnsdorff=False, seed_fraction=0.0,
+                 mutation_rate=0.05, cache=None, elite=0, double_buffered=False, start=0,
+                 closed=False, bitboard=False, incremental=False):
+        self.population_size = population_size
+        self.board = board if board else BOARD
+        # Square index every tour starts from
+        self.start = start
+        # Search for closed tours, which score target_fitness
+        self.closed = closed
+        self.target_fitness = self.board.num_squares + closed
+        self.warnsdorff = warnsdorff
+        # Walk modes of every knight, see Knight
+        self.bitboard = bitboard
+        self.incremental = incremental
+        self.seed_fraction = seed_fraction
+        self.mutation_rate = mutation_rate
+        # Optional FitnessCache that spares walking duplicate chromosomes
+        self.cache = cache
+        # Best knights carried unchanged into the next generation
+        self.elite = elite
+        # Knights at the front of the list that were carried over already
+        # walked, so check_population skips them
+        self._carried = 0
+        self.generation = 1
+        self.knights = self.new_knights(population_size)
+        
+        # Breed children into the knights of a second, preallocated
+        # generation and swap the two, instead of creating new ones
+        self.double_buffered = double_buffered
+        if double_buffered:
+            self._back = [knight.copy() for knight in self.knights]
+            # Receives the second child of the last pair when it is left out
+            self._spare = self.knights[0].copy()
+    
+    def new_knights(self, count):
+        # Start this share of the knights from Warnsdorff walks
+        seeded = int(count * self.seed_fraction)
+        knights = [self.new_knight(warnsdorff_chromosome(self.board, self.start))
+                   for _ in range(seeded)]
+        knights += [self.new_knight() for _ in range(count - seeded)]
+        return knights
+    
+    def new_knight(self, chromosome=None):
+        """A knight with this population's board, start and walk modes"""
+        return Knight(chromosome, self.board, self.warnsdorff, start=self.start, closed=self.closed,
+                      bitboard=self.bitboard, incremental=self.incremental)
+    
+    def check_population(self):
+        knights = self.knights[self._carried:] if self._carried else self.knights
+        cache = self.cache
+        if cache is None:
+            for knight in knights:
+                knight.check_moves()
+            return
+        
+        for knight in knights:
+            # Key on the genes before repair, as duplicates are bred
+            key = cache.key(knight)
+            if not cache.restore(key, knight):
+                knight.check_moves()
+                cache.store(key, knight)
+    
+    def evaluate(self):
+        # check_moves already scored every knight in the same walk
+        max_fitness = 0
+        best_knight = None
+        
+        for knight in self.knights:
+            if knight.fitness > max_fitness:
+                max_fitness = knight.fitness
+                best_knight = knight
+        
+        if self.double_buffered:
+            # The knight will be overwritten two generations from now
+            best_knight = best_knight.copy()
+        return max_fitness, best_knight
+    
+    def mean_fitness(self):
+        return sum(knight.fitness for knight in self.knights) / len(self.knights)
+    
+    def walk_counts(self):
+        """Total (repairs, dead_ends) of the last check_population"""
+        walked = self.knights[self._carried:]
+        return (sum(knight.repairs for knight in walked),
+                sum(knight.dead_ends for knight in walked))
+    
+    def best_knights(self, count):
+        return sorted(self.knights, key=lambda knight: knight.fitness, reverse=True)[:count]
+    
+    def tournament_selection(self, size=3):
+        tournament = random.sample(self.knights, size)
+        tournament.sort(key=lambda x: x.fitness, reverse=True)
+        return tournament[0], tournament[1]
+    
+    def create_new_generation(self):
+        if self.double_buffered:
+            return self.create_new_generation_buffered()
+        
+        new_knights = self.best_knights(self.elite) if self.elite else []
+        self._carried = len(new_knights)
+        
+        while len(new_knights) < self.population_size:
+            parent1, parent2 = self.tournament_selection()
+            
+            child1_chromosome = parent1.chromosome.crossover(parent2.chromosome)
+            child2_chromosome = parent2.chromosome.crossover(parent1.chromosome)
+            
+            child1_chromosome.mutation(self.mutation_rate)
+            child2_chromosome.mutation(self.mutation_rate)
+            
+            new_knights.append(self.new_knight(child1_chromosome))
+            if len(new_knights) < self.population_size:
+                new_knights.append(self.new_knight(child2_chromosome))
+        
+        self.knights = new_knights
+        self.generation += 1
+    
+    def create_new_generation_buffered(self):
+        # Draws the same random numbers in the same order as the
+        # unbuffered create_new_generation, so both breed the same children
+        back = self._back
+        size = self.population_size
+        index = 0
+        if self.elite:
+            for index, elite in enumerate(self.best_knights(self.elite), 1):
+                back[index - 1].copy_walk(elite)
+        self._carried = index
+        
+        while index < size:
+            parent1, parent2 = self.tournament_selection()
+            knight1 = back[index]
+            knight2 = back[index + 1] if index + 1 < size else self._spare
+            
+            child1 = parent1.chromosome.crossover_into(parent2.chromosome, knight1.chromosome)
+            child2 = parent2.chromosome.crossover_into(parent1.chromosome, knight2.chromosome)
+            
+            child1.mutation(self.mutation_rate)
+            child2.mutation(self.mutation_rate)
+            
+            knight1.reset()
+            index += 1
+            if index < size:
+                knight2.reset()
+                index += 1
+        
+        self.knights, self._back = back, self.knights
+        self.generation += 1
+    
+    def restart(self, fraction=1.0):
+        """Replace the worst ``fraction`` of the knights with new ones"""
+        fresh = round(self.population_size * fraction)
+        kept = self.best_knights(self.population_size - fresh)
+        self.knights = kept + self.new_knights(fresh)
+        self._carried = len(kept)
+        self.generation += 1
+
+
+def evolve(population, max_generations=None, instrumentation=None, scheduler=None):
+    """Evolve ``population`` until a knight reaches its ``target_fitness``,
+    a full tour, or a closed one for a closed population.
+
+    Stops early after ``max_generations`` if given. Returns the best knight
+    found and the last generation number. Pass an Instrumentation to
+    collect phase timings and counters, and a Scheduler for time budgets
+    and restarts when the best fitness stagnates.
+    """
+    if scheduler is not None:
+        scheduler.start()
+    best_knight = None
+    
+    while True:
+        if instrumentation is None:
+            population.check_population()
+            max_fit, knight = population.evaluate()
+        else:
+            with instrumentation.phase('check_population'):
+                population.check_population()
+            with instrumentation.phase('evaluate'):
+                max_fit, knight = population.evaluate()
+            instrumentation.end_generation(population, max_fit)
+        
+        # Restarts can lose the best knight, so keep the best one seen
+        if best_knight is None or max_fit > best_knight.fitness:
+            best_knight = knight
+        
+        if max_fit == population.target_fitness:
+            break
+        if max_generations is not None and population.generation >= max_generations:
+            break
+        
+        if scheduler is not None:
+            if scheduler.out_of_budget(population.generation):
+                break
+            if scheduler.should_restart(max_fit):
+                if instrumentation is None:
+                    population.restart(scheduler.restart_fraction)
+                else:
+                    with instrumentation.phase('restart'):
+                        population.restart(scheduler.restart_fraction)
+                    instrumentation.counters['restarts'] += 1
+                continue
+        
+        if instrumentation is None:
+            population.create_new_generation()
+        else:
+            with instrumentation.phase('create_new_generation'):
+                population.create_new_generation()
+            instrumentation.counters['tournaments'] += (population.population_size - population.elite + 1) // 2
+    
+    return best_knight, population.generation
+
+
+def solve(population_size=50, max_generations=None, instrumentation=None, board=None,
+          scheduler=None, start=0, closed=False):
+    return evolve(Population(population_size, board, start=start, closed=closed), max_generations,
+                  instrumentation, scheduler)
@@ -0,0 +1,66 @@
+"""Optional timing and counters for the GA loop.
+
+Pass an Instrumentation to ``evolve()`` to collect cumulative time per
+phase, counters (genes repaired and dead ends hit by check_moves,
+tournaments run) and a per-generation hook. Without one, ``evolve()``
+skips all of it.
+"""
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class GenerationReport:
+    def __init__(self, generation, best_fitness, mean_fitness, instrumentation):
+        self.generation = generation
+        self.best_fitness = best_fitness
+        self.mean_fitness = mean_fitness
+        self.instrumentation = instrumentation
+
+
+class Instrumentation:
+    def __init__(self):
+        # phase name -> cumulative seconds
+        self.timers = defaultdict(float)
+        self.counters = defaultdict(int)
+        self.generations = 0
+        self._subscribers = []
+
+    def subscribe(self, callback):
+        """Call ``callback(report)`` with a GenerationReport every generation"""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        self._subscribers.remove(callback)
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timers[name] += time.perf_counter() - start
+
+    def end_generation(self, population, best_fitness):
+        repairs, dead_ends = population.walk_counts()
+        self.counters['repairs'] += repairs
+        self.counters['dead_ends'] += dead_ends
+        self.counters['individuals'] += population.population_size
+        self.generations += 1
+
+        if self._subscribers:
+            report = GenerationReport(population.generation, best_fitness,
+                                      population.mean_fitness(), self)
+            for callback in self._subscribers:
+                callback(report)
+
+    def summary(self):
+        """Return report lines with phase timings and counters"""
+        total = sum(self.timers.values())
+        lines = [f"{self.generations} generations, {total:.3f}s in GA phases"]
+        for name, seconds in sorted(self.timers.items(), key=lambda item: -item[1]):
+            share = seconds / total * 100 if total else 0
+            lines.append(f"  {name:<24}{seconds:>9.3f}s {share:>5.1f}%")
+        for name, count in sorted(self.counters.items()):
+            lines.append(f"  {name:<24}{count:>10}")
+        return lines
@@ -0,0 +1,148 @@
+"""Island-model genetic algorithm running one Population per process.
+
+Islands are arranged in a ring. Every ``migration_interval`` generations
+each island sends copies of its best ``migrants`` knights to the next
+island, which swaps them in for its worst knights. The run stops as soon
+as any island finds a full tour.
+"""
+import multiprocessing
+import os
+import queue
+import random
+
+from .genetic import BOARD, Population
+
+
+class IslandResult:
+    def __init__(self, island, generation, knight, target_fitness):
+        self.island = island
+        self.generation = generation
+        self.knight = knight
+        # Fitness of a full (closed) tour
+        self.target_fitness = target_fitness
+
+    @property
+    def fitness(self):
+        return self.knight.fitness
+
+    @property
+    def solved(self):
+        return self.knight.fitness == self.target_fitness
+
+
+def replace_worst(population, immigrants):
+    # Immigrants arrive already repaired and scored, so they can enter the
+    # next tournament without being re-evaluated
+    population.knights.sort(key=lambda knight: knight.fitness)
+    population.knights[:len(immigrants)] = immigrants
+
+
+def _run_island(island, board, population_size, population_options, migration_interval,
+                migrants, max_generations, seed, inbox, outbox, stop, results):
+    random.seed(seed)
+    # Don't let unread migrants keep this process alive after the run ends
+    outbox.cancel_join_thread()
+
+    population = Population(population_size, board, **population_options)
+    best_knight = None
+
+    while not stop.is_set():
+        population.check_population()
+        max_fit, knight = population.evaluate()
+        if best_knight is None or max_fit > best_knight.fitness:
+            best_knight = knight
+
+        if max_fit == population.target_fitness:
+            stop.set()
+            break
+        if max_generations is not None and population.generation >= max_generations:
+            break
+
+        if population.generation % migration_interval == 0:
+            outbox.put(population.best_knights(migrants))
+
+        while True:
+            try:
+                immigrants = inbox.get_nowait()
+            except queue.Empty:
+                break
+            replace_worst(population, immigrants)
+
+        population.create_new_generation()
+
+    results.put(IslandResult(island, population.generation, best_knight, population.target_fitness))
+
+
+def run_islands(num_islands=None, population_size=50, migration_interval=10,
+                migrants=2, max_generations=None, seed=None, board=None,
+                population_options=None):
+    """Evolve ``num_islands`` populations in parallel, one per process.
+
+    ``population_options`` are passed on to every island's Population, e.g.
+    ``{'warnsdorff': True}``.
+
+    Returns the IslandResult of the island that found a full tour, or the
+    best partial result if every island ran out of ``max_generations``.
+    Raises RuntimeError if an island process dies without reporting.
+    """
+    if num_islands is None:
+        num_islands = os.cpu_count() or 1
+    board = board if board else BOARD
+
+    context = multiprocessing.get_context()
+    stop = context.Event()
+    results = context.Queue()
+    inboxes = [context.Queue() for _ in range(num_islands)]
+
+    islands = []
+    for island in range(num_islands):
+        island_seed = None if seed is None else seed + island
+        process = context.Process(
+            target=_run_island,
+            args=(island, board, population_size, population_options or {}, migration_interval,
+                  migrants, max_generations,
+                  island_seed, inboxes[island], inboxes[(island + 1) % num_islands],
+                  stop, results),
+            daemon=True,
+        )
+        process.start()
+        islands.append(process)
+
+    best = None
+    reported = set()
+    try:
+        # Every island reports exactly once, either with a solution or its
+        # best partial tour once stopped or out of generations
+        while len(reported) < num_islands:
+            # Islands that exited before this get() had already flushed any
+            # report into the queue, so if it comes back empty they crashed
+            exited = [island for island, process in enumerate(islands)
+                      if island not in reported and process.exitcode is not None]
+            try:
+                result = results.get(timeout=1)
+            except queue.Empty:
+                if exited:
+                    codes = ', '.join(f'{island} (exit code {islands[island].exitcode})'
+                                      for island in exited)
+                    raise RuntimeError(f"islands exited without reporting: {codes}")
+                continue
+            reported.add(result.island)
+            if best is None or result.fitness > best.fitness:
+                best = result
+            if result.solved:
+                break
+    finally:
+        stop.set()
+        # Drain the stragglers' reports so their queues can flush and exit
+        while any(island not in reported and process.is_alive()
+                  for island, process in enumerate(islands)):
+            try:
+                reported.add(results.get(timeout=5).island)
+            except queue.Empty:
+                break
+        for process in islands:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+    return best
@@ -0,0 +1,55 @@
+"""Budgets and stagnation restarts for the GA loop.
+
+Pass a Scheduler to ``evolve()`` to stop a run after a number of
+generations or seconds, returning the best partial tour found, and to
+restart part or all of the population once the best fitness stops
+improving. Elitism is set on the population itself (``elite=k``).
+"""
+import time
+
+
+class Scheduler:
+    def __init__(self, max_generations=None, max_seconds=None, stagnation_limit=None,
+                 restart_fraction=1.0, max_restarts=None):
+        self.max_generations = max_generations
+        self.max_seconds = max_seconds
+        # Generations without a better best fitness before a restart
+        self.stagnation_limit = stagnation_limit
+        # Share of the population replaced by new knights on a restart;
+        # the rest are the best knights, kept as they are
+        self.restart_fraction = restart_fraction
+        self.max_restarts = max_restarts
+        self.restarts = 0
+        self.best_fitness = 0
+        self.stagnant_generations = 0
+        self.deadline = None
+
+    def start(self):
+        self.restarts = 0
+        self.best_fitness = 0
+        self.stagnant_generations = 0
+        self.deadline = None if self.max_seconds is None else time.perf_counter() + self.max_seconds
+
+    def out_of_budget(self, generation):
+        if self.max_generations is not None and generation >= self.max_generations:
+            return True
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def should_restart(self, best_fitness):
+        """Track the best fitness and return True once it has stagnated"""
+        if best_fitness > self.best_fitness:
+            self.best_fitness = best_fitness
+            self.stagnant_generations = 0
+            return False
+
+        self.stagnant_generations += 1
+        if self.stagnation_limit is None or self.stagnant_generations < self.stagnation_limit:
+            return False
+        if self.max_restarts is not None and self.restarts >= self.max_restarts:
+            return False
+
+        self.restarts += 1
+        # Measure stagnation afresh from the restarted population
+        self.best_fitness = 0
+        self.stagnant_generations = 0
+        return True
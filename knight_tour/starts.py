@@ -0,0 +1,80 @@
+"""Solve tours from many start squares in parallel.
+
+Each start square is an independent GA run, so ``solve_starts()`` fans the
+runs out over a process pool and yields a StartResult as each one finishes,
+fastest first, rather than waiting for the whole board.
+"""
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .genetic import BOARD, Population, evolve
+
+
+class StartResult:
+    def __init__(self, start, knight, generations, seconds, target_fitness):
+        self.start = start
+        self.knight = knight
+        self.generations = generations
+        # Wall time of this start's run inside its worker process
+        self.seconds = seconds
+        # Fitness of a full (closed) tour
+        self.target_fitness = target_fitness
+
+    @property
+    def fitness(self):
+        return self.knight.fitness
+
+    @property
+    def solved(self):
+        return self.knight.fitness == self.target_fitness
+
+
+def _solve_start(start, board, population_size, max_generations, population_options, seed,
+                 scheduler, engine):
+    began = time.perf_counter()
+    if engine == 'batch':
+        from .batch import BatchPopulation
+        population = BatchPopulation(population_size, board, seed=seed, start=start,
+                                     **population_options)
+    else:
+        if seed is not None:
+            random.seed(seed)
+        population = Population(population_size, board, start=start, **population_options)
+    knight, generations = evolve(population, max_generations, scheduler=scheduler)
+    return StartResult(start, knight, generations, time.perf_counter() - began,
+                       population.target_fitness)
+
+
+def solve_starts(starts=None, board=None, population_size=50, max_generations=None,
+                 population_options=None, seed=None, processes=None, scheduler=None,
+                 engine='scalar'):
+    """Solve a tour from every square in ``starts`` and yield StartResults.
+
+    ``starts`` are square indices and default to every square of the
+    board. Runs are spread over ``processes`` worker processes (default:
+    one per CPU) and yielded in the order they finish. ``population_options``
+    are passed on to every Population (BatchPopulation with
+    ``engine='batch'``), and each run gets a copy of ``scheduler``. A run
+    from start ``s`` is seeded with ``seed + s``, so results don't depend
+    on how runs are spread over processes.
+    """
+    board = board if board else BOARD
+    if starts is None:
+        starts = range(board.num_squares)
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(_solve_start, start, board, population_size, max_generations,
+                                   population_options or {},
+                                   None if seed is None else seed + start, scheduler, engine)
+                   for start in starts]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # Stop queued runs if the caller stops reading early
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,167 @@
+"""Persistent library of found tours.
+
+Tours are appended to one binary file and read back through a memory map,
+so a board that was solved before is answered without running the GA.
+The file starts with ``MAGIC``, followed by records of a ``RECORD`` header
+(board width, height, start square, tour type) and the tour's square
+indices, little-endian, in the board's ``square_typecode``.
+
+The default file is ``$KNIGHT_TOUR_STORE``, or ``knight_tour/tours.bin``
+in the user's cache directory.
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from .board import square_typecode
+
+MAGIC = b'KTOURS\x00\x01'
+RECORD = struct.Struct('<HHIB')
+OPEN, CLOSED = 0, 1
+
+
+def default_path():
+    if os.environ.get('KNIGHT_TOUR_STORE'):
+        return os.environ['KNIGHT_TOUR_STORE']
+    cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_dir, 'knight_tour', 'tours.bin')
+
+
+class Tour:
+    """A stored tour, read like a solved Knight."""
+
+    __slots__ = ('board', 'squares', 'closed')
+
+    def __init__(self, board, squares, closed=False):
+        self.board = board
+        self.squares = squares
+        self.closed = closed
+
+    @property
+    def fitness(self):
+        # Scored like a Knight: one more for a closed tour
+        return len(self.squares) + self.closed
+
+    @property
+    def start(self):
+        return self.squares[0]
+
+    @property
+    def path(self):
+        positions = self.board.positions
+        return [positions[square] for square in self.squares]
+
+    @property
+    def position(self):
+        return self.board.positions[self.squares[-1]]
+
+
+class TourStore:
+    def __init__(self, path=None):
+        self.path = path if path else default_path()
+        # (width, height, start, tour type) -> payload offsets in the file
+        self._index = {}
+        self._map = None
+        self._file = None
+        # Bytes of the file indexed so far; later appends, ours or another
+        # process's, are indexed on the next lookup
+        self._indexed = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = self._file = None
+
+    def _refresh(self):
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+        if size <= self._indexed:
+            return
+
+        self.close()
+        self._file = open(self.path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        data = self._map
+        if self._indexed == 0:
+            if data[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{self.path} is not a tour store")
+            self._indexed = len(MAGIC)
+
+        offset = self._indexed
+        while offset + RECORD.size <= size:
+            width, height, start, tour_type = RECORD.unpack_from(data, offset)
+            payload = offset + RECORD.size
+            num_squares = width * height
+            end = payload + num_squares * array(square_typecode(num_squares)).itemsize
+            if end > size:
+                # A record still being written, or cut short by a crash
+                break
+            self._index.setdefault((width, height, start, tour_type), []).append(payload)
+            offset = end
+        self._indexed = offset
+
+    def _read(self, board, offset):
+        squares = array(board.square_typecode)
+        squares.frombytes(self._map[offset:offset + board.num_squares * squares.itemsize])
+        if sys.byteorder == 'big':
+            squares.byteswap()
+        return squares
+
+    def _offsets(self, board, start, closed):
+        self._refresh()
+        return self._index.get((board.width, board.height, start, CLOSED if closed else OPEN), ())
+
+    def get(self, board, start=0, closed=False):
+        """Return the first stored Tour for this board and start, or None"""
+        offsets = self._offsets(board, start, closed)
+        if not offsets:
+            return None
+        return Tour(board, self._read(board, offsets[0]), closed)
+
+    def tours(self, board, start=0, closed=False):
+        """Return every stored Tour for this board and start"""
+        return [Tour(board, self._read(board, offset), closed)
+                for offset in self._offsets(board, start, closed)]
+
+    def count(self, board, start=0, closed=False):
+        return len(self._offsets(board, start, closed))
+
+    def add(self, board, squares, closed=False):
+        """Append a tour given as square indices; False if already stored.
+
+        Raises ValueError if ``squares`` is not a full (closed) tour.
+        """
+        if not board.is_tour(squares, closed):
+            kind = 'closed tour' if closed else 'tour'
+            raise ValueError(f"not a {kind} of the {board.width}x{board.height} board")
+        payload = array(board.square_typecode, squares)
+        if sys.byteorder == 'big':
+            payload.byteswap()
+        payload = payload.tobytes()
+
+        start = squares[0]
+        for offset in self._offsets(board, start, closed):
+            if self._map[offset:offset + len(payload)] == payload:
+                return False
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        record = RECORD.pack(board.width, board.height, start, CLOSED if closed else OPEN) + payload
+        # One append per record, so concurrent writers don't interleave
+        with open(self.path, 'ab') as f:
+            if f.tell() == 0:
+                record = MAGIC + record
+            f.write(record)
+        return True
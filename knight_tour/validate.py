@@ -0,0 +1,91 @@
+"""Independent, vectorized checks that tours are legal.
+
+``validate_tours()`` takes one tour or a stacked batch of them, as square
+indices or ``(x, y)`` positions, and checks every one at once with a few
+NumPy array operations, so whole tour libraries and benchmark outputs can
+be verified in one call. Unlike ``Board.is_tour()`` it reports which
+check failed.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from .batch import move_table
+from .genetic import BOARD
+
+LEGAL_MOVES, ALL_SQUARES, CLOSED = 'legal_moves', 'all_squares', 'closed'
+
+
+@lru_cache(maxsize=None)
+def adjacency(board):
+    # adjacency(board)[a, b] -> True if a knight moves from square a to b
+    table = move_table(board)
+    adjacent = np.zeros((board.num_squares, board.num_squares), dtype=bool)
+    rows = np.repeat(np.arange(board.num_squares), table.shape[1])
+    targets = table.ravel()
+    on_board = targets >= 0
+    adjacent[rows[on_board], targets[on_board]] = True
+    return adjacent
+
+
+def _as_squares(tours, board):
+    tours = np.asarray(tours)
+    # Positions have a trailing (x, y) axis; only a 2-square board's tours
+    # could be mistaken for them
+    if tours.ndim == 3 or (tours.ndim == 2 and tours.shape[1] == 2 and board.num_squares != 2):
+        # (x, y) positions; off-board ones become -1
+        x, y = tours[..., 0], tours[..., 1]
+        on_board = (x >= 0) & (x < board.width) & (y >= 0) & (y < board.height)
+        tours = np.where(on_board, y * board.width + x, -1)
+    return tours.astype(np.intp, copy=False)
+
+
+def check_tours(tours, board=None, closed=False):
+    """Return a dict of per-tour boolean arrays, one per check.
+
+    ``tours`` is a ``(count, num_squares)`` array of square indices, a
+    ``(count, num_squares, 2)`` array of positions, or a single tour of
+    either. ``legal_moves`` is every step a knight move between squares on
+    the board, ``all_squares`` every square visited exactly once, and with
+    ``closed`` also ``closed``, the last square a knight move from the
+    first. Tours of the wrong length fail every check.
+    """
+    board = board if board else BOARD
+    squares = _as_squares(tours, board)
+    single = squares.ndim == 1
+    squares = np.atleast_2d(squares)
+    count = len(squares)
+
+    if squares.shape[1] != board.num_squares:
+        failed = np.zeros(count, dtype=bool)
+        checks = {LEGAL_MOVES: failed, ALL_SQUARES: failed}
+        if closed:
+            checks[CLOSED] = failed
+    else:
+        on_board = (squares >= 0) & (squares < board.num_squares)
+        # Off-board squares are checked as square 0 and already failed
+        squares = np.where(on_board, squares, 0)
+        adjacent = adjacency(board)
+        checks = {
+            LEGAL_MOVES: on_board.all(axis=1) & adjacent[squares[:, :-1], squares[:, 1:]].all(axis=1),
+            # As many squares as the board, so no repeats means full coverage
+            ALL_SQUARES: on_board.all(axis=1) & (np.sort(squares, axis=1) ==
+                                                 np.arange(board.num_squares)).all(axis=1),
+        }
+        if closed:
+            checks[CLOSED] = adjacent[squares[:, -1], squares[:, 0]]
+
+    if single:
+        return {name: bool(passed[0]) for name, passed in checks.items()}
+    return checks
+
+
+def validate_tours(tours, board=None, closed=False):
+    """True for each tour in ``tours`` that passes every check_tours() check.
+
+    Returns a boolean array for a batch, or a bool for a single tour.
+    """
+    checks = list(check_tours(tours, board, closed).values())
+    if isinstance(checks[0], bool):
+        return all(checks)
+    return np.logical_and.reduce(checks)
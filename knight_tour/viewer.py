@@ -0,0 +1,1005 @@
+"""Pygame viewer for the Knight's Tour genetic algorithm.
+
+Nothing is initialized at import time: call ``init()`` (``run()`` does it
+for you) to open the window and load fonts. Images and sounds are loaded
+on a background thread, with placeholders until they arrive.
+"""
+import os
+import sys
+import random
+import time
+import math
+import queue
+import threading
+from collections import OrderedDict
+
+import pygame
+
+from .genetic import BOARD
+from .scheduler import Scheduler
+from .store import TourStore
+from .worker import SolverWorker
+
+ASSET_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Constants
+SCREEN_WIDTH = 1000
+SCREEN_HEIGHT = 700
+BOARD_SIZE = 400
+CELL_SIZE = BOARD_SIZE // 8
+MIN_NUMBERED_CELL_SIZE = 20  # Smaller cells are too small for move numbers
+FPS = 60
+# Playback speeds of the solution viewer, in moves per second
+MIN_SPEED = 1
+MAX_SPEED = 4096
+# Shortest gap between two plays of the same sound, so fast playback
+# doesn't stack one sound per move
+SOUND_INTERVAL = 0.08
+
+# Colors
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+GRAY = (200, 200, 200)
+LIGHT_BROWN = (240, 217, 181)
+DARK_BROWN = (181, 136, 99)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+YELLOW = (255, 255, 0)
+PURPLE = (128, 0, 128)
+LIGHT_BLUE = (173, 216, 230)
+DARK_BLUE = (0, 0, 139)
+GOLD = (255, 215, 0)
+DARK_GREEN = (0, 100, 0)
+MENU_BG = (30, 30, 60)  # Dark blue background
+
+# Posted by the asset loader so a sleeping screen wakes up to use them
+ASSETS_LOADED = pygame.event.custom_type()
+
+# Set by init()
+screen = None
+clock = None
+title_font = None
+button_font = None
+info_font = None
+small_font = None
+knight_image = None
+background_image = None
+sounds = {}
+# Seconds from the start of init() to the first frame on screen
+time_to_first_frame = None
+_init_started = None
+_loader = None
+
+class SurfaceCache:
+    """Bounded LRU cache of rendered surfaces, shared by every screen.
+
+    Text is keyed by (font, string, color), so a screen re-renders only the
+    strings that changed since they were last drawn. Other surfaces are
+    built by a function on a miss and keyed by whatever identifies them.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, build):
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = self._entries[key] = build()
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surface
+
+    def text(self, font, text, color):
+        return self.get((font, text, color), lambda: font.render(text, True, color))
+
+    def clear(self):
+        self._entries.clear()
+
+surfaces = SurfaceCache()
+
+def asset_path(name):
+    return os.path.join(ASSET_DIR, name)
+
+def asset_cache_dir():
+    """Directory of pre-scaled images, ``$KNIGHT_TOUR_ASSET_CACHE`` or the user cache"""
+    if os.environ.get('KNIGHT_TOUR_ASSET_CACHE'):
+        return os.environ['KNIGHT_TOUR_ASSET_CACHE']
+    cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_dir, 'knight_tour', 'assets')
+
+def load_scaled(name, size, prepare=None, alpha=False):
+    """Load image ``name`` scaled to ``size``, from the disk cache if it has it.
+
+    The cache holds raw pixels keyed by file name, size and the source's
+    modification time, so a later start skips decoding and scaling.
+    ``prepare`` is applied to the decoded image before it is scaled.
+    Raises OSError or pygame.error if the image can't be read.
+    """
+    source = asset_path(name)
+    stat = os.stat(source)
+    pixel_format = 'RGBA' if alpha else 'RGB'
+    cached = os.path.join(asset_cache_dir(), f"{os.path.splitext(name)[0]}-{size[0]}x{size[1]}-"
+                                             f"{stat.st_mtime_ns}-{stat.st_size}.{pixel_format.lower()}")
+    try:
+        with open(cached, 'rb') as f:
+            return pygame.image.frombytes(f.read(), size, pixel_format)
+    except (OSError, ValueError, pygame.error):
+        pass
+    
+    image = pygame.image.load(source)
+    if prepare is not None:
+        image = prepare(image)
+    image = pygame.transform.scale(image, size)
+    try:
+        os.makedirs(os.path.dirname(cached), exist_ok=True)
+        # Written aside and renamed, so a reader never sees half a file
+        with open(cached + '.tmp', 'wb') as f:
+            f.write(pygame.image.tobytes(image, pixel_format))
+        os.replace(cached + '.tmp', cached)
+    except OSError:
+        pass
+    return image
+
+def without_white(image):
+    # White is the knight image's background: make it transparent. Blitting
+    # the color-keyed image onto a transparent surface does what
+    # convert_alpha() would, without needing the display
+    image.set_colorkey((255, 255, 255))
+    transparent = pygame.Surface(image.get_size(), pygame.SRCALPHA)
+    transparent.blit(image, (0, 0))
+    return transparent
+
+def knight_placeholder():
+    # Create a simple placeholder with transparent background
+    placeholder = pygame.Surface((CELL_SIZE - 10, CELL_SIZE - 10), pygame.SRCALPHA)
+    # Draw a simple knight shape
+    pygame.draw.rect(placeholder, (100, 100, 200, 255), (5, 5, CELL_SIZE-20, CELL_SIZE-20), border_radius=8)
+    pygame.draw.polygon(placeholder, (150, 150, 220, 255), [
+        (CELL_SIZE - 15, 10), 
+        (CELL_SIZE - 25, CELL_SIZE - 25), 
+        (10, CELL_SIZE - 25)
+    ])
+    return placeholder
+
+# Load knight image and remove white background
+def load_knight_image():
+    try:
+        # Scale it to fit nicely in a cell
+        return load_scaled('knight.png', (CELL_SIZE - 10, CELL_SIZE - 10), without_white, alpha=True)
+    except (OSError, pygame.error):
+        print("Knight image 'knight.png' not found in the same folder as the script!")
+        return None
+
+# Load background image
+def load_background_image():
+    try:
+        return load_scaled('background.jpg', (SCREEN_WIDTH, SCREEN_HEIGHT))
+    except (OSError, pygame.error):
+        print("Background image 'background.jpg' not found. Using solid color background.")
+        return None
+
+# Load sounds
+def load_sounds():
+    sounds = {}
+    try:
+        sounds['click'] = pygame.mixer.Sound(asset_path('click.wav'))
+        sounds['move'] = pygame.mixer.Sound(asset_path('move.wav'))
+        sounds['success'] = pygame.mixer.Sound(asset_path('success.wav'))
+        # Set volume for sounds
+        for sound in sounds.values():
+            sound.set_volume(0.5)
+    except:
+        print("Sound files not found. Continuing without sound.")
+    return sounds
+
+class AssetLoader(threading.Thread):
+    """Loads images and sounds off the main thread.
+
+    Each asset is queued as (name, value) as soon as it is ready, cheapest
+    first, and an ASSETS_LOADED event wakes the screen to pick it up with
+    ``apply_loaded_assets()``. Nothing here touches the display.
+    """
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.loaded = queue.Queue()
+
+    def run(self):
+        for name, load in (('knight_image', load_knight_image),
+                           ('background_image', load_background_image),
+                           ('sounds', load_sounds)):
+            self.loaded.put((name, load()))
+            try:
+                pygame.event.post(pygame.event.Event(ASSETS_LOADED))
+            except pygame.error:
+                # The display was closed while loading
+                return
+
+def apply_loaded_assets():
+    """Swap in assets the loader finished; True if any arrived"""
+    global knight_image, background_image
+    if _loader is None:
+        return False
+    arrived = False
+    while True:
+        try:
+            name, value = _loader.loaded.get_nowait()
+        except queue.Empty:
+            return arrived
+        arrived = True
+        if name == 'knight_image' and value is not None:
+            # Converted here, as only the main thread may use the display
+            knight_image = value.convert_alpha()
+            _scaled_knight_images.clear()
+        elif name == 'background_image' and value is not None:
+            background_image = value.convert()
+        elif name == 'sounds':
+            # Update in place: buttons hold on to this dict
+            sounds.update(value)
+
+_last_played = {}
+
+def play_sound(name, min_interval=SOUND_INTERVAL):
+    """Play a sound unless it already played less than ``min_interval`` seconds ago"""
+    sound = sounds.get(name)
+    if sound is None:
+        return
+    now = time.time()
+    if now - _last_played.get(name, -min_interval) < min_interval:
+        return
+    _last_played[name] = now
+    sound.play()
+
+def init():
+    global screen, clock, title_font, button_font, info_font, small_font
+    global knight_image, background_image, time_to_first_frame, _init_started, _loader
+    
+    _init_started = time.perf_counter()
+    time_to_first_frame = None
+    
+    # Initialize Pygame and mixer for sound
+    pygame.init()
+    pygame.mixer.init()
+    
+    # Set up the display
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Knight's Tour Genetic Algorithm")
+    clock = pygame.time.Clock()
+    
+    # Fonts
+    title_font = pygame.font.SysFont('Arial', 48, bold=True)
+    button_font = pygame.font.SysFont('Arial', 32)
+    info_font = pygame.font.SysFont('Arial', 24)
+    small_font = pygame.font.SysFont('Arial', 18)
+    
+    # Surfaces cached from an earlier display are no longer valid
+    _scaled_knight_images.clear()
+    _move_glyphs.clear()
+    _board_renderers.clear()
+    surfaces.clear()
+    
+    # Load resources in the background once the first frame is drawn,
+    # with placeholders until then: a drawn knight, the plain menu
+    # background and no sounds
+    knight_image = knight_placeholder()
+    background_image = None
+    sounds.clear()
+    _loader = AssetLoader()
+
+class Button:
+    def __init__(self, x, y, width, height, text, color, hover_color, sound_effects=None):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.text = text
+        self.color = color
+        self.hover_color = hover_color
+        self.current_color = color
+        self.sound_effects = sound_effects
+        self.hover_played = False
+    
+    def render(self, color):
+        """The whole button in ``color``, drawn on a transparent surface"""
+        face = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        rect = face.get_rect()
+        # Draw button with gradient effect
+        pygame.draw.rect(face, color, rect, border_radius=15)
+        
+        # Add a subtle border
+        border_color = (min(color[0] + 30, 255), 
+                       min(color[1] + 30, 255), 
+                       min(color[2] + 30, 255))
+        pygame.draw.rect(face, border_color, rect, 3, border_radius=15)
+        
+        # Add a highlight at the top
+        highlight = pygame.Rect(0, 0, rect.width, 5)
+        highlight_color = (min(color[0] + 50, 255), 
+                          min(color[1] + 50, 255), 
+                          min(color[2] + 50, 255))
+        pygame.draw.rect(face, highlight_color, highlight, border_radius=15)
+        
+        text_surf = surfaces.text(button_font, self.text, WHITE)
+        face.blit(text_surf, text_surf.get_rect(center=rect.center))
+        return face
+    
+    def draw(self, surface):
+        # Buttons with the same size, text and color share one face
+        key = ('button', self.rect.size, self.text, self.current_color)
+        surface.blit(surfaces.get(key, lambda: self.render(self.current_color)), self.rect)
+    
+    def check_hover(self, pos):
+        if self.rect.collidepoint(pos):
+            if not self.hover_played and self.sound_effects and 'hover' in self.sound_effects:
+                self.sound_effects['hover'].play()
+                self.hover_played = True
+            self.current_color = self.hover_color
+            return True
+        self.hover_played = False
+        self.current_color = self.color
+        return False
+    
+    def is_clicked(self, pos, event):
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.rect.collidepoint(pos):
+                if self.sound_effects and 'click' in self.sound_effects:
+                    self.sound_effects['click'].play()
+                return True
+        return False
+
+class FrameScheduler:
+    """Draws a screen only where and when it changed.
+
+    Screens mark the regions that changed with ``invalidate()`` and, when
+    ``dirty``, redraw under ``begin()``, which clips drawing to those regions,
+    then ``present()`` them with ``pygame.display.update(rects)``. While
+    ``animating``, ``events()`` paces frames at FPS; otherwise it sleeps in
+    ``pygame.event.wait()`` until an event arrives or ``timeout`` ms pass.
+    """
+
+    def __init__(self):
+        self.rects = []
+        # Redraw and present the whole screen on the next frame
+        self.full = True
+        self.animating = False
+
+    @property
+    def dirty(self):
+        return self.full or bool(self.rects)
+
+    def invalidate(self, rect=None):
+        """Mark ``rect`` for redrawing, or the whole screen if None"""
+        if rect is None:
+            self.full = True
+        else:
+            self.rects.append(pygame.Rect(rect))
+
+    def track(self, button, mouse_pos):
+        """Update the hover state of ``button``, marking it if its look changed"""
+        color = button.current_color
+        button.check_hover(mouse_pos)
+        if button.current_color != color:
+            self.invalidate(button.rect)
+
+    def begin(self):
+        if not self.full:
+            screen.set_clip(self.rects[0].unionall(self.rects[1:]))
+
+    def present(self):
+        global time_to_first_frame
+        screen.set_clip(None)
+        if self.full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.rects)
+        self.rects = []
+        self.full = False
+        if time_to_first_frame is None:
+            time_to_first_frame = time.perf_counter() - _init_started
+            # Decoding competes with drawing for the interpreter, so only
+            # start once the first frame is up
+            _loader.start()
+
+    def events(self, timeout=None):
+        """Return the events to handle, sleeping first if nothing is going on"""
+        if self.animating or self.dirty:
+            # Pace animations, but draw anything else straight away
+            clock.tick(FPS if self.animating else 0)
+            events = pygame.event.get()
+        else:
+            event = pygame.event.wait() if timeout is None else pygame.event.wait(max(int(timeout), 1))
+            events = pygame.event.get()
+            if event.type != pygame.NOEVENT:
+                events.insert(0, event)
+            # Don't count the sleep as frame time once animating again
+            clock.tick()
+        # Newly loaded images replace placeholders anywhere on screen
+        if apply_loaded_assets():
+            self.invalidate()
+        return events
+
+def cell_size_for(board):
+    # Fit the longer side of the board into BOARD_SIZE pixels
+    return BOARD_SIZE // max(board.width, board.height)
+
+_scaled_knight_images = {}
+
+def knight_image_for(cell_size):
+    if cell_size == CELL_SIZE:
+        return knight_image
+    if cell_size not in _scaled_knight_images:
+        # Same proportion of the cell as the standard board's knight
+        size = max(cell_size * (CELL_SIZE - 10) // CELL_SIZE, 1)
+        _scaled_knight_images[cell_size] = pygame.transform.scale(knight_image, (size, size))
+    return _scaled_knight_images[cell_size]
+
+_move_glyphs = {}
+
+def move_glyph(number):
+    # Move numbers never change, so each is rendered once; kept apart from
+    # the shared SurfaceCache, as a board needs all of its numbers at once
+    if number not in _move_glyphs:
+        _move_glyphs[number] = small_font.render(str(number), True, WHITE)
+    return _move_glyphs[number]
+
+class BoardRenderer:
+    """Draws a board and a tour on it with a few blits per frame.
+
+    The squares are drawn once onto a board surface. Path lines and the
+    circles and numbers of visited squares go onto two transparent layers,
+    lines under markers, which only get the moves made since the last
+    frame. Showing another path redraws the layers.
+
+    For a path given to ``prepare()``, copies of the layers are taken
+    every ``snapshot_interval`` moves, so seeking either way restores the
+    nearest snapshot and draws at most an interval of moves. Other paths
+    are redrawn from the start when stepping back.
+    """
+
+    # Snapshots kept per path, each a copy of both layers
+    SNAPSHOTS = 16
+
+    def __init__(self, board):
+        self.board = board
+        self.cell_size = cell_size_for(board)
+        size = (board.width * self.cell_size, board.height * self.cell_size)
+        self.board_surface = pygame.Surface(size).convert()
+        for col, row in board.positions:
+            color = LIGHT_BROWN if (row + col) % 2 == 0 else DARK_BROWN
+            pygame.draw.rect(self.board_surface, color,
+                             (col * self.cell_size, row * self.cell_size,
+                              self.cell_size, self.cell_size))
+        self.line_layer = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        self.marker_layer = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        # The path on the layers, and how many of its moves are drawn
+        self.path = None
+        self.drawn = 0
+        # Moves drawn -> (line layer, marker layer) copies, taken every
+        # snapshot_interval moves of a prepared path
+        self.snapshots = {}
+        self.snapshot_interval = None
+
+    def center(self, pos):
+        half = self.cell_size // 2
+        return (pos[0] * self.cell_size + half, pos[1] * self.cell_size + half)
+
+    def clear(self):
+        self.line_layer.fill((0, 0, 0, 0))
+        self.marker_layer.fill((0, 0, 0, 0))
+        self.drawn = 0
+
+    def reset(self, path, snapshots=False):
+        self.path = path
+        self.snapshots.clear()
+        self.snapshot_interval = max(-(-len(path) // self.SNAPSHOTS), 1) if snapshots else None
+        self.clear()
+
+    def restore(self, current_move_index):
+        """Go back to the last snapshot at or before ``current_move_index``"""
+        if self.snapshot_interval is None:
+            self.clear()
+            return
+        drawn = current_move_index // self.snapshot_interval * self.snapshot_interval
+        if drawn not in self.snapshots:
+            self.clear()
+            return
+        lines, markers = self.snapshots[drawn]
+        self.line_layer = lines.copy()
+        self.marker_layer = markers.copy()
+        self.drawn = drawn
+
+    def prepare(self, path):
+        """Draw all of ``path`` once to take its snapshots, then rewind"""
+        self.reset(path, snapshots=True)
+        self.advance(path, len(path) - 1)
+        self.restore(0)
+
+    def advance(self, path, current_move_index):
+        """Bring the layers up to ``current_move_index`` of ``path``"""
+        if path is not self.path:
+            self.reset(path)
+        elif current_move_index < self.drawn:
+            self.restore(current_move_index)
+        elif self.snapshot_interval and current_move_index - self.drawn > self.snapshot_interval:
+            # Jumping forward past a snapshot: start from the nearest one
+            nearest = current_move_index // self.snapshot_interval * self.snapshot_interval
+            if nearest in self.snapshots:
+                self.restore(current_move_index)
+        numbered = self.cell_size >= MIN_NUMBERED_CELL_SIZE
+        interval = self.snapshot_interval
+        for i in range(self.drawn, current_move_index):
+            center = self.center(path[i])
+            if i < len(path) - 1:
+                pygame.draw.line(self.line_layer, BLUE, center, self.center(path[i + 1]), 2)
+            pygame.draw.circle(self.marker_layer, GREEN if i == 0 else PURPLE, center,
+                               self.cell_size // 4)
+            if numbered:
+                glyph = move_glyph(i + 1)
+                self.marker_layer.blit(glyph, glyph.get_rect(center=center))
+            if interval and (i + 1) % interval == 0 and i + 1 not in self.snapshots:
+                self.snapshots[i + 1] = (self.line_layer.copy(), self.marker_layer.copy())
+        self.drawn = max(self.drawn, current_move_index)
+
+    def draw(self, surface, offset_x, offset_y, knight_path=None, current_move_index=0):
+        surface.blit(self.board_surface, (offset_x, offset_y))
+        if not knight_path or current_move_index >= len(knight_path):
+            return
+        
+        self.advance(knight_path, current_move_index)
+        surface.blit(self.line_layer, (offset_x, offset_y))
+        surface.blit(self.marker_layer, (offset_x, offset_y))
+        
+        # The knight on its current square
+        x, y = self.center(knight_path[current_move_index])
+        knight_icon = knight_image_for(self.cell_size)
+        surface.blit(knight_icon, knight_icon.get_rect(center=(offset_x + x, offset_y + y)))
+
+_board_renderers = {}
+
+def board_renderer(board):
+    if board not in _board_renderers:
+        _board_renderers[board] = BoardRenderer(board)
+    return _board_renderers[board]
+
+def draw_chessboard(offset_x, offset_y, knight_path=None, current_move_index=0, board=BOARD):
+    board_renderer(board).draw(screen, offset_x, offset_y, knight_path, current_move_index)
+
+def menu_background():
+    # Solid color with a subtle pattern, for when there is no background image
+    background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    background.fill(MENU_BG)
+    for i in range(0, SCREEN_WIDTH, 40):
+        for j in range(0, SCREEN_HEIGHT, 40):
+            if (i + j) % 80 == 0:
+                pygame.draw.rect(background, (40, 40, 80), (i, j, 20, 20))
+    return background
+
+def pause_overlay():
+    pause_surface = pygame.Surface((300, 80), pygame.SRCALPHA)
+    pause_surface.fill((0, 0, 0, 180))  # Semi-transparent black
+    pygame.draw.rect(pause_surface, WHITE, (5, 5, 290, 70), 2, border_radius=10)
+    
+    pause_text = surfaces.text(title_font, "PAUSED", YELLOW)
+    text_rect = pause_text.get_rect(center=(150, 40))
+    pause_surface.blit(pause_text, text_rect)
+    return pause_surface
+
+def main_menu():
+    # Create a more attractive button
+    start_button = Button(SCREEN_WIDTH // 2 - 125, SCREEN_HEIGHT // 2, 250, 60, 
+                         "START TOUR", (50, 150, 50), (100, 200, 100), sounds)
+    # Runs the GA even when the tour library already has a tour
+    new_button = Button(SCREEN_WIDTH // 2 - 125, SCREEN_HEIGHT // 2 + 80, 250, 60,
+                        "NEW TOUR", (50, 100, 150), (100, 150, 200), sounds)
+    
+    # Create decorative chess pieces (simplified)
+    chess_pieces = []
+    for i in range(8):
+        chess_pieces.append({
+            'pos': (random.randint(50, SCREEN_WIDTH-50), random.randint(100, SCREEN_HEIGHT-100)),
+            'size': random.randint(20, 40),
+            'color': LIGHT_BROWN if i % 2 == 0 else DARK_BROWN,
+            'speed': random.uniform(0.5, 2)
+        })
+    
+    # Animation variables
+    angle = 0
+    last_time = time.time()
+    frames = FrameScheduler()
+    title_rect = None
+    
+    while True:
+        # The title's tilt changes a few times a second, so wake up often
+        # enough to follow it and sleep in between
+        events = frames.events(timeout=50)
+        current_time = time.time()
+        dt = current_time - last_time
+        last_time = current_time
+        angle += dt * 30  # Rotate title slowly
+        
+        mouse_pos = pygame.mouse.get_pos()
+        
+        for event in events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            
+            new_tour = new_button.is_clicked(mouse_pos, event)
+            if new_tour or start_button.is_clicked(mouse_pos, event):
+                main(new_tour)
+                # Back to the menu once the search is cancelled or the
+                # solution viewer is closed
+                last_time = time.time()
+                frames.invalidate()
+        
+        # Create a rotated version of the title; a tenth of a degree
+        # apart, the few distinct angles are each rotated once
+        title_text = surfaces.text(title_font, "KNIGHT'S TOUR", GOLD)
+        tilt = round(math.sin(angle * 0.01) * 2, 1)
+        rotated_title = surfaces.get(('title', tilt),
+                                     lambda: pygame.transform.rotate(title_text, tilt))
+        new_title_rect = rotated_title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
+        if new_title_rect != title_rect:
+            # The old title's area and the new one's, shadow included
+            if title_rect is not None:
+                frames.invalidate(title_rect.union(new_title_rect).inflate(8, 8))
+            title_rect = new_title_rect
+        
+        frames.track(start_button, mouse_pos)
+        frames.track(new_button, mouse_pos)
+        if not frames.dirty:
+            continue
+        frames.begin()
+        
+        # Draw background
+        if background_image:
+            screen.blit(background_image, (0, 0))
+        else:
+            screen.blit(surfaces.get('menu background', menu_background), (0, 0))
+        
+        # Draw title with rotation effect, over a shadow
+        shadow_text = surfaces.text(title_font, "KNIGHT'S TOUR", (20, 20, 20))
+        shadow_rect = shadow_text.get_rect(center=(SCREEN_WIDTH // 2 + 3, SCREEN_HEIGHT // 3 + 3))
+        screen.blit(shadow_text, shadow_rect)
+        
+        screen.blit(rotated_title, title_rect)
+        
+        # Draw subtitle
+        subtitle_text = surfaces.text(info_font, "Genetic Algorithm Solution", GOLD)
+        subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3 + 60))
+        screen.blit(subtitle_text, subtitle_rect)
+        
+        # Draw button
+        start_button.draw(screen)
+        new_button.draw(screen)
+        
+        # Draw footer
+        footer_text = surfaces.text(small_font, "START TOUR shows a stored tour if there is one, NEW TOUR always searches", WHITE)
+        footer_rect = footer_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
+        screen.blit(footer_text, footer_rect)
+        
+        frames.present()
+
+def main(new_tour=False):
+    population_size = 50
+    store = TourStore()
+    
+    # Play background music or sound if available
+    if 'success' in sounds:
+        sounds['success'].play()  # Play a sound when starting the algorithm
+    
+    # A tour found before is shown straight away unless a new one is asked for
+    if not new_tour:
+        tour = store.get(BOARD)
+        if tour is not None:
+            show_solution_interface(tour, None)
+            return
+    
+    # Run genetic algorithm on a worker so the window stays responsive
+    # Keep the best knights, restart most of the population when it
+    # stagnates and show the best partial tour after two minutes at most
+    worker = SolverWorker(population_size, population_options={'elite': 2},
+                          scheduler=Scheduler(max_seconds=120, stagnation_limit=100,
+                                              restart_fraction=0.8))
+    worker.start()
+    progress = show_progress_interface(worker)
+    if progress is None:
+        return
+    if progress.solved:
+        store.add(BOARD, progress.best_knight.squares, progress.best_knight.closed)
+    
+    # Create the user interface to display the solution
+    show_solution_interface(progress.best_knight, progress.generation)
+
+def show_progress_interface(worker):
+    """Show live search progress until the worker finishes or is cancelled"""
+    board_offset_x = (SCREEN_WIDTH - BOARD_SIZE) // 2
+    board_offset_y = (SCREEN_HEIGHT - BOARD_SIZE) // 2 - 50
+    
+    cancel_button = Button(SCREEN_WIDTH // 2 - 75, BOARD_SIZE + board_offset_y + 90, 150, 50,
+                           "Cancel", (180, 60, 60), (220, 90, 90), sounds)
+    
+    board_rect = pygame.Rect(board_offset_x, board_offset_y, BOARD_SIZE, BOARD_SIZE)
+    bar_rect = pygame.Rect(board_offset_x, BOARD_SIZE + board_offset_y + 30, BOARD_SIZE, 24)
+    status_rect = pygame.Rect(0, 80, SCREEN_WIDTH, info_font.get_linesize())
+    
+    progress = None
+    status = None
+    start_time = time.time()
+    frames = FrameScheduler()
+    
+    while True:
+        # The worker can't wake us, so check on it ten times a second,
+        # which is as often as the elapsed time changes
+        events = frames.events(timeout=100)
+        mouse_pos = pygame.mouse.get_pos()
+        
+        for event in events:
+            if event.type == pygame.QUIT:
+                worker.cancel()
+                pygame.quit()
+                sys.exit()
+            
+            if cancel_button.is_clicked(mouse_pos, event):
+                worker.cancel()
+                return None
+        
+        latest = worker.poll()
+        if latest is not None:
+            progress = latest
+            if progress.finished:
+                return progress
+            frames.invalidate(board_rect)
+            frames.invalidate(bar_rect)
+        
+        if progress is not None:
+            new_status = f"Generation: {progress.generation} | Best Fitness: {progress.best_fitness}/{progress.target_fitness}"
+        else:
+            new_status = "Starting..."
+        new_status += f" | Elapsed: {time.time() - start_time:.1f}s"
+        if new_status != status:
+            status = new_status
+            frames.invalidate(status_rect)
+        
+        frames.track(cancel_button, mouse_pos)
+        if not frames.dirty:
+            continue
+        frames.begin()
+        
+        screen.fill(WHITE)
+        
+        # Draw the best partial tour found so far
+        if progress is not None:
+            draw_chessboard(board_offset_x, board_offset_y, progress.best_path,
+                            len(progress.best_path) - 1, worker.board)
+        else:
+            draw_chessboard(board_offset_x, board_offset_y, board=worker.board)
+        
+        title_text = surfaces.text(title_font, "Searching for a Knight's Tour...", DARK_BLUE)
+        screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 20))
+        
+        info_text = surfaces.text(info_font, status, BLACK)
+        screen.blit(info_text, (SCREEN_WIDTH // 2 - info_text.get_width() // 2, 80))
+        
+        # Progress bar for the best fitness
+        pygame.draw.rect(screen, GRAY, bar_rect, border_radius=8)
+        if progress is not None:
+            filled = bar_rect.copy()
+            filled.width = BOARD_SIZE * progress.best_fitness // progress.target_fitness
+            pygame.draw.rect(screen, GREEN, filled, border_radius=8)
+        pygame.draw.rect(screen, BLACK, bar_rect, 2, border_radius=8)
+        
+        cancel_button.draw(screen)
+        
+        frames.present()
+
+def show_solution_interface(best_solution, generations):
+    """Display a solution, or the best partial tour, on an interface"""
+    board_offset_x = (SCREEN_WIDTH - BOARD_SIZE) // 2
+    board_offset_y = (SCREEN_HEIGHT - BOARD_SIZE) // 2 - 50
+    # Knights build their path on access, so build it once
+    path = best_solution.path
+    target_fitness = best_solution.board.num_squares + best_solution.closed
+    # A run out of budget hands over its best partial tour instead
+    if best_solution.fitness == target_fitness:
+        title, title_color = "Knight's Tour Solution Found!", GREEN
+    else:
+        title, title_color = f"Best Partial Tour ({best_solution.fitness}/{target_fitness})", RED
+    
+    back_button = Button(20, 20, 100, 40, "Back", GRAY, (180, 180, 180), sounds)
+    replay_button = Button(SCREEN_WIDTH - 120, 20, 100, 40, "Replay", LIGHT_BLUE, DARK_BLUE, sounds)
+    
+    animation_speed = 5  # moves per second, changed with UP/DOWN
+    current_move = 0
+    last_move = len(path) - 1
+    # Start playing with a move straight away
+    last_move_time = time.time() - 1 / animation_speed
+    playing = True
+    seeking = False
+    show_pause_text = False
+    pause_text_timer = 0
+    pause_text_duration = 2  # seconds to show pause text
+    
+    # Regions redrawn when the move, play state or pause text changes
+    board_rect = pygame.Rect(board_offset_x, board_offset_y, BOARD_SIZE, BOARD_SIZE)
+    move_rect = pygame.Rect(0, BOARD_SIZE + board_offset_y + 20, SCREEN_WIDTH, info_font.get_linesize())
+    status_rect = move_rect.move(0, 30)
+    overlay_rect = pygame.Rect(SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2 - 40, 300, 80)
+    # Click or drag on the bar to jump to a move
+    seek_rect = pygame.Rect(board_offset_x, BOARD_SIZE + board_offset_y + 130, BOARD_SIZE, 14)
+    frames = FrameScheduler()
+    
+    # Snapshots of the drawn path make any jump cost at most a few moves
+    board_renderer(best_solution.board).prepare(path)
+    
+    def seek_to(x):
+        fraction = (x - seek_rect.x) / seek_rect.width
+        return min(max(round(fraction * last_move), 0), last_move)
+    
+    # Play success sound when solution is found
+    if 'success' in sounds:
+        sounds['success'].play()
+    
+    while True:
+        # While paused, sleep until an event or the pause text is due to hide
+        frames.animating = playing and current_move < last_move
+        timeout = None
+        if show_pause_text:
+            timeout = (pause_text_timer + pause_text_duration - time.time()) * 1000 + 1
+        events = frames.events(timeout)
+        
+        shown = (current_move, playing, show_pause_text, animation_speed)
+        current_time = time.time()
+        mouse_pos = pygame.mouse.get_pos()
+        
+        for event in events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            
+            if back_button.is_clicked(mouse_pos, event):
+                return
+            
+            if replay_button.is_clicked(mouse_pos, event):
+                current_move = 0
+                playing = True
+                last_move_time = current_time
+                show_pause_text = False
+                play_sound('move')
+            
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and seek_rect.collidepoint(event.pos):
+                seeking = True
+            if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                seeking = False
+            if seeking and event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION):
+                current_move = seek_to(event.pos[0])
+                last_move_time = current_time
+            
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    playing = not playing
+                    if not playing:
+                        # Show pause text when pausing
+                        show_pause_text = True
+                        pause_text_timer = current_time
+                    else:
+                        # Hide pause text when resuming
+                        show_pause_text = False
+                        last_move_time = current_time
+                elif event.key == pygame.K_RIGHT:
+                    current_move = min(current_move + 1, last_move)
+                    playing = False  # Pause when manually stepping
+                    show_pause_text = True
+                    pause_text_timer = current_time
+                    play_sound('move')
+                elif event.key == pygame.K_LEFT:
+                    current_move = max(current_move - 1, 0)
+                    playing = False  # Pause when manually stepping
+                    show_pause_text = True
+                    pause_text_timer = current_time
+                    play_sound('move')
+                elif event.key in (pygame.K_UP, pygame.K_DOWN):
+                    if event.key == pygame.K_UP:
+                        animation_speed = min(animation_speed * 2, MAX_SPEED)
+                    else:
+                        animation_speed = max(animation_speed // 2, MIN_SPEED)
+                    # Time already waited doesn't count at the new speed
+                    last_move_time = current_time
+                elif event.key in (pygame.K_HOME, pygame.K_END, pygame.K_PAGEUP, pygame.K_PAGEDOWN):
+                    # Jump to either end, or a tenth of the tour back or on
+                    step = max(last_move // 10, 1)
+                    current_move = {
+                        pygame.K_HOME: 0,
+                        pygame.K_END: last_move,
+                        pygame.K_PAGEUP: max(current_move - step, 0),
+                        pygame.K_PAGEDOWN: min(current_move + step, last_move),
+                    }[event.key]
+                    last_move_time = current_time
+        
+        # Animate moves: every move due since the last one, however many
+        # that is at high speed
+        if playing and current_move < last_move:
+            due = int((current_time - last_move_time) * animation_speed)
+            if due:
+                current_move = min(current_move + due, last_move)
+                last_move_time += due / animation_speed
+                play_sound('move')
+        
+        # Hide pause text after duration
+        if show_pause_text and current_time - pause_text_timer > pause_text_duration:
+            show_pause_text = False
+        
+        if current_move != shown[0]:
+            frames.invalidate(board_rect)
+            frames.invalidate(move_rect)
+            frames.invalidate(seek_rect)
+        if playing != shown[1] or animation_speed != shown[3]:
+            frames.invalidate(status_rect)
+        if show_pause_text != shown[2]:
+            frames.invalidate(overlay_rect)
+        frames.track(back_button, mouse_pos)
+        frames.track(replay_button, mouse_pos)
+        if not frames.dirty:
+            continue
+        frames.begin()
+        
+        screen.fill(WHITE)
+        
+        # Draw chessboard with current animation state
+        draw_chessboard(board_offset_x, board_offset_y, path, current_move, best_solution.board)
+        
+        # Draw buttons
+        back_button.draw(screen)
+        replay_button.draw(screen)
+        
+        # Display information
+        title_text = surfaces.text(title_font, title, title_color)
+        screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 20))
+        
+        found = "From tour library" if generations is None else f"Generations: {generations}"
+        info_text = surfaces.text(info_font, f"{found} | Moves: {len(path)} | Fitness: {best_solution.fitness}/{target_fitness}", BLACK)
+        screen.blit(info_text, (SCREEN_WIDTH // 2 - info_text.get_width() // 2, 80))
+        
+        move_text = surfaces.text(info_font, f"Current Move: {current_move}/{last_move}", BLACK)
+        screen.blit(move_text, (SCREEN_WIDTH // 2 - move_text.get_width() // 2, BOARD_SIZE + board_offset_y + 20))
+        
+        # Show play/pause status
+        status_text = surfaces.text(info_font, "Status: " + ("Playing" if playing else "Paused") +
+                                    f" | Speed: {animation_speed} moves/s",
+                                    GREEN if playing else RED)
+        screen.blit(status_text, (SCREEN_WIDTH // 2 - status_text.get_width() // 2, BOARD_SIZE + board_offset_y + 50))
+        
+        controls_text = surfaces.text(small_font, "Controls: SPACE = Pause/Play, LEFT/RIGHT = Step through moves, UP/DOWN = Speed", BLACK)
+        screen.blit(controls_text, (SCREEN_WIDTH // 2 - controls_text.get_width() // 2, BOARD_SIZE + board_offset_y + 80))
+        seek_text = surfaces.text(small_font, "HOME/END/PAGE UP/PAGE DOWN or click the bar = Jump to a move", BLACK)
+        screen.blit(seek_text, (SCREEN_WIDTH // 2 - seek_text.get_width() // 2, BOARD_SIZE + board_offset_y + 102))
+        
+        # Seek bar with the share of the tour played so far
+        pygame.draw.rect(screen, GRAY, seek_rect, border_radius=6)
+        if last_move:
+            played = seek_rect.copy()
+            played.width = seek_rect.width * current_move // last_move
+            pygame.draw.rect(screen, BLUE, played, border_radius=6)
+        pygame.draw.rect(screen, BLACK, seek_rect, 1, border_radius=6)
+        
+        # Show pause text temporarily when pausing
+        if show_pause_text:
+            screen.blit(surfaces.get('pause overlay', pause_overlay), overlay_rect)
+        
+        frames.present()
+
+def run(best_solution=None, generations=None):
+    """Open the viewer on the main menu, or straight on a given solution"""
+    init()
+    if best_solution is None:
+        main_menu()
+    else:
+        show_solution_interface(best_solution, generations)
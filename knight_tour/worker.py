@@ -0,0 +1,88 @@
+"""Run the genetic algorithm on a background thread.
+
+The worker posts a Progress message to its ``progress`` queue after every
+generation, so a UI can keep drawing while the search runs and cancel it
+between generations.
+"""
+import queue
+import threading
+
+from .genetic import BOARD, Population
+
+
+class Progress:
+    def __init__(self, generation, best_fitness, best_path, target_fitness,
+                 finished=False, best_knight=None):
+        self.generation = generation
+        self.best_fitness = best_fitness
+        # Only the part of the path walked before the first dead end
+        self.best_path = best_path
+        # Fitness of a full (closed) tour
+        self.target_fitness = target_fitness
+        self.finished = finished
+        self.best_knight = best_knight
+
+    @property
+    def solved(self):
+        return self.best_fitness == self.target_fitness
+
+
+class SolverWorker(threading.Thread):
+    def __init__(self, population_size=50, max_generations=None, board=None,
+                 population_options=None, scheduler=None):
+        super().__init__(daemon=True)
+        self.population_size = population_size
+        self.board = board if board else BOARD
+        self.max_generations = max_generations
+        # Extra Population arguments, e.g. {'elite': 2}
+        self.population_options = population_options or {}
+        # Optional Scheduler for a time budget and stagnation restarts
+        self.scheduler = scheduler
+        self.progress = queue.Queue()
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def run(self):
+        population = Population(self.population_size, self.board, **self.population_options)
+        target_fitness = population.target_fitness
+        scheduler = self.scheduler
+        if scheduler is not None:
+            scheduler.start()
+        best_knight = None
+
+        while not self._cancel.is_set():
+            population.check_population()
+            max_fit, knight = population.evaluate()
+            # Restarts can lose the best knight, so report the best one seen
+            if best_knight is None or max_fit > best_knight.fitness:
+                best_knight = knight
+            best_fit = best_knight.fitness
+
+            finished = (best_fit == target_fitness or
+                        (self.max_generations is not None and
+                         population.generation >= self.max_generations) or
+                        (scheduler is not None and scheduler.out_of_budget(population.generation)))
+            self.progress.put(Progress(population.generation, best_fit, best_knight.path[:best_fit],
+                                       target_fitness, finished, best_knight if finished else None))
+            if finished:
+                return
+
+            if scheduler is not None and scheduler.should_restart(max_fit):
+                population.restart(scheduler.restart_fraction)
+            else:
+                population.create_new_generation()
+
+    def poll(self):
+        """Return the latest queued Progress, or None if nothing new arrived"""
+        latest = None
+        while True:
+            try:
+                latest = self.progress.get_nowait()
+            except queue.Empty:
+                return latest
@@ -0,0 +1,93 @@
+"""Seeded checks that the optimized engines and walks match the reference.
+
+The batch engine must repair and score exactly like ``Knight.check_moves``,
+and every walk mode of a scalar Population must breed the same
+generations as the default bytearray walk.
+"""
+import random
+
+import pytest
+
+from knight_tour.board import get_board
+from knight_tour.cache import FitnessCache
+from knight_tour.genetic import Chromosome, Knight, Population
+
+np = pytest.importorskip('numpy')
+from knight_tour.batch import evaluate_batch  # noqa: E402
+from knight_tour.validate import validate_tours  # noqa: E402
+
+BOARDS = [(8, 8), (5, 7)]
+
+
+@pytest.mark.parametrize('closed', [False, True])
+@pytest.mark.parametrize('size', BOARDS)
+def test_evaluate_batch_matches_check_moves(size, closed):
+    board = get_board(*size)
+    rng = np.random.default_rng(sum(size) + closed)
+    count = 200
+    for start in (0, board.num_squares // 2, board.num_squares - 1):
+        genes = rng.integers(0, 8, size=(count, board.num_squares - 1), dtype=np.int8)
+        cycle_directions = rng.choice(np.array([1, -1], dtype=np.int8), size=count)
+        repaired = genes.copy()
+        paths, fitness = evaluate_batch(repaired, cycle_directions, board, start=start,
+                                        closed=closed)
+        for row in range(count):
+            knight = Knight(Chromosome(genes[row].tolist()), board,
+                            cycle_direction=int(cycle_directions[row]), start=start, closed=closed)
+            knight.check_moves()
+            assert knight.fitness == fitness[row]
+            assert knight.chromosome.genes.tolist() == repaired[row].tolist()
+            assert knight.squares.tolist() == paths[row].tolist()
+
+
+def generations(seed, size, count, **options):
+    """Genes and fitness of every knight over ``count`` generations"""
+    random.seed(seed)
+    population = Population(30, get_board(*size), **options)
+    history = []
+    for _ in range(count):
+        population.check_population()
+        population.evaluate()
+        history.append([(knight.chromosome.genes.tolist(), knight.fitness)
+                        for knight in population.knights])
+        population.create_new_generation()
+    return history
+
+
+WALK_MODES = {
+    'bitboard': {'bitboard': True},
+    'incremental': {'incremental': True},
+    'double_buffered': {'double_buffered': True},
+    'elite double_buffered': {'double_buffered': True, 'elite': 2},
+    'fitness cache': {'cache': FitnessCache()},
+}
+
+
+@pytest.mark.parametrize('mode', sorted(WALK_MODES))
+@pytest.mark.parametrize('size', BOARDS)
+def test_walk_modes_match_default(size, mode):
+    options = WALK_MODES[mode]
+    reference = {'elite': options['elite']} if 'elite' in options else {}
+    assert generations(1, size, 15, **options) == generations(1, size, 15, **reference)
+
+
+@pytest.mark.parametrize('size', BOARDS)
+def test_warnsdorff_walk_modes_match(size):
+    reference = generations(2, size, 15, warnsdorff=True, seed_fraction=0.2)
+    for options in ({'incremental': True}, {'bitboard': True}):
+        assert generations(2, size, 15, warnsdorff=True, seed_fraction=0.2, **options) == reference
+
+
+@pytest.mark.parametrize('closed', [False, True])
+@pytest.mark.parametrize('size', BOARDS)
+def test_validate_tours_matches_is_tour(size, closed):
+    board = get_board(*size)
+    random.seed(3)
+    population = Population(50, board, warnsdorff=True, seed_fraction=1.0, closed=closed)
+    population.check_population()
+    tours = [knight.squares for knight in population.knights]
+    # Break some of them
+    tours[1][-1] = tours[1][0]
+    tours[2][3], tours[2][4] = tours[2][4], tours[2][3]
+    expected = [board.is_tour(list(squares), closed) for squares in tours]
+    assert validate_tours(tours, board, closed).tolist() == expected
@@ -0,0 +1,50 @@
+"""Seeking with BoardRenderer snapshots must draw what a fresh render draws."""
+import os
+import random
+
+import pytest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+pygame = pytest.importorskip('pygame')
+
+from knight_tour import viewer  # noqa: E402
+from knight_tour.board import get_board  # noqa: E402
+from knight_tour.genetic import Knight, warnsdorff_chromosome  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def display(tmp_path_factory):
+    os.environ['KNIGHT_TOUR_ASSET_CACHE'] = str(tmp_path_factory.mktemp('assets'))
+    viewer.init()
+    yield
+    pygame.quit()
+
+
+def layers(renderer):
+    return (pygame.image.tobytes(renderer.line_layer, 'RGBA'),
+            pygame.image.tobytes(renderer.marker_layer, 'RGBA'))
+
+
+@pytest.mark.parametrize('size', [(8, 8), (5, 7), (20, 20)])
+def test_snapshot_seek_matches_fresh_render(display, size):
+    board = get_board(*size)
+    knight = Knight(warnsdorff_chromosome(board), board)
+    knight.check_moves()
+    path = knight.path
+
+    seeking = viewer.BoardRenderer(board)
+    seeking.prepare(path)
+    rng = random.Random(sum(size))
+    interval = seeking.snapshot_interval
+    # Forward and backward jumps of every length, onto and around snapshots
+    targets = [rng.randrange(len(path)) for _ in range(20)]
+    for snapshot in range(interval, len(path), interval):
+        targets += [snapshot + 1, snapshot, snapshot - 1]
+    targets += [len(path) - 1, 0, len(path) - 1]
+    for target in targets:
+        target = min(target, len(path) - 1)
+        seeking.advance(path, target)
+        fresh = viewer.BoardRenderer(board)
+        fresh.advance(path, target)
+        assert layers(seeking) == layers(fresh), target